@@ -0,0 +1,123 @@
+"""
+Parse-throughput benchmark for the BeautifulSoup parser backends.
+
+Reads saved pages laid out as ``<pages_dir>/<platform>/*.html`` and reports,
+for every installed backend, pages parsed per second and how many deals each
+backend extracted, so we can pick the fastest backend that still extracts
+correctly.
+
+    python -m benchmarks.parse_benchmark --save      # fetch current deal pages
+    python -m benchmarks.parse_benchmark -n 20       # benchmark saved pages
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers import (
+    AsyncFetcher,
+    FlipkartScraper,
+    AmazonScraper,
+    JioMartScraper,
+    MyntraScraper,
+    SwiggyInstatmartScraper,
+    BigBasketScraper
+)
+from scrapers.base import PARSER_BACKENDS
+
+SCRAPER_CLASSES = {
+    cls.platform: cls for cls in (
+        FlipkartScraper,
+        AmazonScraper,
+        JioMartScraper,
+        MyntraScraper,
+        SwiggyInstatmartScraper,
+        BigBasketScraper
+    )
+}
+
+DEFAULT_PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+def load_pages(pages_dir: str) -> Dict[str, List[Tuple[str, bytes]]]:
+    """Load saved pages grouped by platform"""
+    pages = {}
+    for platform in sorted(SCRAPER_CLASSES):
+        platform_dir = os.path.join(pages_dir, platform)
+        if not os.path.isdir(platform_dir):
+            continue
+        for name in sorted(os.listdir(platform_dir)):
+            if name.endswith(".html"):
+                with open(os.path.join(platform_dir, name), "rb") as f:
+                    pages.setdefault(platform, []).append((name, f.read()))
+    return pages
+
+async def save_pages(pages_dir: str):
+    """Fetch every scraper's deal URLs and save the raw pages"""
+    fetcher = AsyncFetcher()
+    try:
+        for platform, cls in SCRAPER_CLASSES.items():
+            scraper = cls()
+            platform_dir = os.path.join(pages_dir, platform)
+            os.makedirs(platform_dir, exist_ok=True)
+            for i, url in enumerate(scraper._get_deal_urls()):
+                try:
+                    content = await fetcher.get(url, headers=scraper.headers, timeout=scraper.timeout)
+                except Exception as e:
+                    print(f"  {platform}: failed to fetch {url}: {e}")
+                    continue
+                with open(os.path.join(platform_dir, f"page{i}.html"), "wb") as f:
+                    f.write(content)
+                print(f"  {platform}: saved {url} ({len(content)} bytes)")
+    finally:
+        await fetcher.close()
+
+def benchmark(pages: Dict[str, List[Tuple[str, bytes]]], backend: str, iterations: int):
+    """Parse every page ``iterations`` times; return (pages/sec, deals per platform)"""
+    deals_found = {}
+    parsed = 0
+    start = time.perf_counter()
+    for platform, platform_pages in pages.items():
+        scraper = SCRAPER_CLASSES[platform](parser=backend)
+        scraper.fallback_parser = None  # measure the backend on its own
+        for _ in range(iterations):
+            count = 0
+            for name, content in platform_pages:
+                count += len(scraper._parse_deals_page(content, name))
+                parsed += 1
+            deals_found[platform] = count
+    elapsed = time.perf_counter() - start
+    return (parsed / elapsed if elapsed else 0.0), deals_found
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages-dir", default=DEFAULT_PAGES_DIR)
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("--backends", nargs="+", default=PARSER_BACKENDS)
+    parser.add_argument("--save", action="store_true", help="fetch and save pages, then exit")
+    args = parser.parse_args()
+
+    if args.save:
+        asyncio.run(save_pages(args.pages_dir))
+        return
+
+    pages = load_pages(args.pages_dir)
+    if not pages:
+        sys.exit(f"No saved pages under {args.pages_dir}; run with --save first")
+
+    platforms = sorted(pages)
+    print(f"{'backend':<12} {'pages/sec':>10}  " + "  ".join(f"{p:>9}" for p in platforms))
+    for backend in args.backends:
+        if backend != "html.parser" and importlib.util.find_spec(backend) is None:
+            print(f"{backend:<12} {'not installed':>10}")
+            continue
+        rate, deals_found = benchmark(pages, backend, args.iterations)
+        print(f"{backend:<12} {rate:>10.1f}  " + "  ".join(f"{deals_found.get(p, 0):>9}" for p in platforms))
+
+if __name__ == "__main__":
+    main()
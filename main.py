@@ -1,24 +1,41 @@
-from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request, BackgroundTasks, Query
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 import razorpay
 import os
 from dotenv import load_dotenv
 import asyncio
-import concurrent.futures
-from typing import List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Callable, Iterable, Union
 import logging
 import time
 from datetime import datetime
 
 # Import scraper modules
+from scrapers.executor import ScrapeExecutor
+from scrapers.fetch import AsyncFetcher
+from scrapers.http_cache import HTTPCache
 from scrapers.flipkart import FlipkartScraper
 from scrapers.amazon import AmazonScraper
 from scrapers.jiomart import JioMartScraper
 from scrapers.myntra import MyntraScraper
 from scrapers.swiggy import SwiggyInstatmartScraper
 from scrapers.bigbasket import BigBasketScraper
+from services.refresh import RefreshScheduler, SingleFlight
+from services.deal_index import DealIndex
+from services.events import ChangeFeed
+from services.leader import LeaderLock
+from services.matching import ProductMatcher
+from services.search import SearchIndex
+from services.price_history import PriceHistory
+from services.encoding import EncodedBody, choose_encoding, dumps_json
+from services.changelog import Changelog
+from services.cache_backend import DealsCacheView, TimestampView, create_cache_backend
+from services.snapshot import (
+    DealSnapshot, build_snapshot, compute_etag, decode_cursor, diff_snapshots, encode_cursor, etag_matches,
+    format_version, parse_price, parse_version, project, variant_etag
+)
 
 # Load environment variables
 load_dotenv()
@@ -27,7 +44,43 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Deal Aggregator API", version="1.0.0")
+# Shared async HTTP client (one connection pool for every platform); pages
+# are revalidated against an on-disk cache unless SCRAPER_HTTP_CACHE_DIR is empty
+http_cache_dir = os.getenv("SCRAPER_HTTP_CACHE_DIR", ".http_cache")
+fetcher = AsyncFetcher(
+    limit=int(os.getenv("SCRAPER_MAX_CONNECTIONS", "30")),
+    limit_per_host=int(os.getenv("SCRAPER_MAX_CONNECTIONS_PER_HOST", "4")),
+    cache=HTTPCache(http_cache_dir) if http_cache_dir else None
+)
+
+# One bounded executor for all blocking scrape work (HTML parsing); set
+# SCRAPE_PARSE_PROCESSES to parse in a process pool across cores
+scrape_executor = ScrapeExecutor(
+    max_workers=int(os.getenv("SCRAPE_EXECUTOR_WORKERS", "4")),
+    max_queue=int(os.getenv("SCRAPE_EXECUTOR_QUEUE", "32")),
+    platform_slots=int(os.getenv("SCRAPE_EXECUTOR_PLATFORM_SLOTS", "2")),
+    parse_processes=int(os.getenv("SCRAPE_PARSE_PROCESSES", "0"))
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open and close application-scoped resources"""
+    # Warm start: load whatever the shared cache already holds. The diff
+    # from the empty import-time snapshot says nothing about which deals
+    # older versions held, so clients before this version must resync
+    await sync_cache()
+    changelog.clear()
+    cache_watcher = asyncio.create_task(watch_shared_cache())
+    refresh_scheduler.start()
+    yield
+    await refresh_scheduler.stop()
+    cache_watcher.cancel()
+    await fetcher.close()
+    scrape_executor.shutdown()
+    cache_backend.close()
+    price_history.close()
+
+app = FastAPI(title="Deal Aggregator API", version="1.0.0", lifespan=lifespan)
 
 # CORS middleware for frontend integration
 app.add_middleware(
@@ -59,9 +112,21 @@ scrapers = {
     "bigbasket": BigBasketScraper()
 }
 
-# Cache for deals (simple in-memory cache)
-deals_cache = {}
-cache_timestamp = {}
+# Cache for deals. The backend is shared by every uvicorn worker (SQLite,
+# persisted across restarts) unless DEALS_CACHE_BACKEND=memory; the two
+# read-only views below are this process's synced copy of it.
+cache_backend = create_cache_backend(
+    os.getenv("DEALS_CACHE_BACKEND", "sqlite"),
+    os.getenv("DEALS_DB_PATH", "deals.db")
+)
+deals_cache = DealsCacheView(cache_backend)
+cache_timestamp = TimestampView(cache_backend)
+CACHE_SYNC_INTERVAL = float(os.getenv("DEALS_CACHE_SYNC_INTERVAL", "1"))
+CACHE_TTL = int(os.getenv("DEALS_CACHE_TTL", "300"))  # seconds
+# How long /deals/stream waits for never-scraped platforms before giving up
+STREAM_WAIT = float(os.getenv("DEALS_STREAM_WAIT", "20"))  # seconds
+# Comment line sent on idle /deals/events connections so proxies keep them open
+EVENTS_KEEPALIVE = float(os.getenv("DEALS_EVENTS_KEEPALIVE", "30"))  # seconds
 
 # Sample deals for immediate display
 sample_deals = {
@@ -117,6 +182,101 @@ sample_deals = {
     ]
 }
 
+# Deal-ID lookup for payment verification; rotated-out deals stay
+# resolvable for DEAL_INDEX_RETENTION seconds
+deal_index = DealIndex(retention=int(os.getenv("DEAL_INDEX_RETENTION", str(24 * 3600))))
+
+# Price changes of every scraped deal, for /deals/{deal_id}/history
+price_history = PriceHistory(os.getenv("PRICE_HISTORY_DB_PATH", os.getenv("DEALS_DB_PATH", "deals.db")))
+
+# Merged /deals view, rebuilt whenever a platform's cache entry changes
+deals_snapshot: DealSnapshot = build_snapshot(0, sample_deals, deals_cache, scrapers, epoch=cache_backend.epoch)
+
+# Same-product listings across platforms (/compare/{deal_id}) and the title
+# index behind /search; both are re-indexed per platform as it refreshes and
+# hold scraped deals only (a sample deal cannot be paid for)
+product_matcher = ProductMatcher()
+search_index = SearchIndex()
+
+# Recent snapshot diffs, so /deals/changes can catch clients up by version
+changelog = Changelog(max_entries=int(os.getenv("DEALS_CHANGELOG_SIZE", "256")))
+
+# Notifies streaming and SSE clients whenever platforms change (after the
+# rebuild), with the snapshot diff and its SSE event encoded once for all
+deal_updates = ChangeFeed()
+
+# Bumped when the deals change without the cache version advancing (a write
+# that only reached memory), so version tokens handed out before stay unique
+local_generation = 0
+
+def snapshot_epoch() -> str:
+    if local_generation:
+        return f"{cache_backend.epoch}.{local_generation}"
+    return cache_backend.epoch
+
+def rebuild_snapshot():
+    """Recompute the merged /deals snapshot from the cache"""
+    global deals_snapshot
+    deals_snapshot = build_snapshot(cache_backend.version, sample_deals, deals_cache, scrapers,
+                                    epoch=snapshot_epoch())
+
+def client_diff(diff: Dict[str, Any], epoch: str) -> Dict[str, Any]:
+    """A changelog diff with its versions as client version tokens"""
+    return {**diff, "from_version": format_version(epoch, diff["from_version"]),
+            "version": format_version(epoch, diff["version"])}
+
+async def sync_cache():
+    """Pull in cache writes (ours and other workers') and rebuild derived views"""
+    # The SQLite read can wait on the database lock, so keep it off the loop
+    changed = await asyncio.to_thread(cache_backend.sync)
+    if changed:
+        apply_cache_changes(changed)
+
+def apply_cache_changes(changed: List[str]):
+    """Rebuild the snapshot and indexes for changed platforms and notify clients"""
+    for platform in changed:
+        deal_index.update_platform(platform, deals_cache.get(platform, []))
+    global local_generation
+    previous = deals_snapshot
+    rebuild_snapshot()
+    diff = diff_snapshots(previous, deals_snapshot)
+    modified = bool(diff["added"] or diff["changed"] or diff["removed"])
+    if modified and deals_snapshot.version <= previous.version and deals_snapshot.epoch == previous.epoch:
+        # Same token, different deals: start a new epoch and make clients resync
+        local_generation += 1
+        rebuild_snapshot()
+    event = None
+    if deals_snapshot.epoch != previous.epoch:
+        changelog.clear()
+        token = deals_snapshot.version_token
+        event = sse_event("resync", dumps_json({"version": token}), event_id=token)
+    else:
+        changelog.record(diff)
+        if modified:
+            event = sse_event("deals", dumps_json(client_diff(diff, deals_snapshot.epoch)),
+                              event_id=deals_snapshot.version_token)
+    for platform in changed:
+        cached_ids = {deal.get("id") for deal in deals_cache.get(platform, [])}
+        platform_deals = [deal for deal in deals_snapshot.platform_deals.get(platform, ())
+                          if deal.get("id") in cached_ids]
+        product_matcher.update_platform(platform, platform_deals)
+        search_index.update_platform(platform, platform_deals)
+    deal_updates.publish({"version": deals_snapshot.version, "platforms": changed, "event": event})
+
+def sse_event(name: str, data: bytes, event_id: Optional[str] = None) -> bytes:
+    """One Server-Sent Events message (``data`` must be a single line)"""
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {name}\n".encode() + b"data: " + data + b"\n\n"
+
+async def watch_shared_cache():
+    """Keep this worker's view in step with writes from other workers"""
+    while True:
+        await asyncio.sleep(CACHE_SYNC_INTERVAL)
+        try:
+            await sync_cache()
+        except Exception as e:
+            logger.error(f"Failed to sync shared deal cache: {str(e)}")
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
     """Serve the main HTML page"""
@@ -186,10 +346,9 @@ async def verify_payment(request: Request):
             raise HTTPException(status_code=400, detail="Invalid payment signature")
         
         # Get the deal and generate affiliate link
-        platform_deals = deals_cache.get(platform, [])
-        deal = next((d for d in platform_deals if d.get("id") == deal_id), None)
+        deal = deal_index.get(deal_id)
         
-        if not deal:
+        if not deal or deal.get("platform") != platform:
             raise HTTPException(status_code=404, detail="Deal not found")
         
         affiliate_link = generate_affiliate_link(deal["url"], platform)
@@ -247,115 +406,372 @@ def generate_affiliate_link(original_url: str, platform: str) -> str:
     
     return original_url
 
+# Concurrent scrapes of the same platform share one in-flight scrape
+scrape_flight = SingleFlight()
+
 async def scrape_platform_async(platform: str, scraper) -> List[Dict[str, Any]]:
     """Asynchronously scrape deals from a platform"""
+    return await scrape_flight.do(platform, lambda: _scrape_platform(platform, scraper))
+
+async def _scrape_platform(platform: str, scraper) -> List[Dict[str, Any]]:
     try:
-        loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            deals = await loop.run_in_executor(executor, scraper.get_deals)
-            return deals
+        # Pages are fetched on the event loop; the executor only parses HTML
+        return await scraper.get_deals_async(fetcher, scrape_executor)
     except Exception as e:
         logger.error(f"Error scraping {platform}: {str(e)}")
         return []
 
+def is_cache_fresh(platform: str) -> bool:
+    """Whether the cached deals for a platform are within the TTL"""
+    timestamp = cache_timestamp.get(platform)
+    return (timestamp is not None and
+            (datetime.now() - timestamp).total_seconds() < CACHE_TTL and
+            platform in deals_cache)
+
+async def store_platform_deals(platform: str, deals: List[Dict[str, Any]]):
+    """Write freshly scraped deals into the cache"""
+    if not deals and deals_cache.get(platform):
+        # Keep serving the previous deals if a refresh came back empty
+        logger.warning(f"Refresh of {platform} returned no deals, keeping cached deals")
+        deals = deals_cache[platform]
+    
+    # SQLite writes can wait up to their busy timeout, so run them off the loop
+    now = datetime.now()
+    try:
+        await asyncio.to_thread(cache_backend.set, platform, deals, now)
+    except Exception as e:
+        # The backend already holds the new deals locally; keep serving them
+        logger.error(f"Failed to persist {platform} deals, serving them from memory: {str(e)}")
+    await sync_cache()
+    
+    try:
+        await asyncio.to_thread(price_history.record, deals, now.timestamp())
+    except Exception as e:
+        logger.error(f"Failed to record {platform} price history: {str(e)}")
+
+async def refresh_platform(platform: str):
+    """Scrape a platform and update its cache entry"""
+    deals = await scrape_platform_async(platform, scrapers[platform])
+    await store_platform_deals(platform, deals)
+
+# With a shared cache, one elected worker scrapes and the others only read
+scrape_leader = None
+if os.getenv("DEALS_CACHE_BACKEND", "sqlite") != "memory":
+    scrape_leader = LeaderLock(os.getenv("DEALS_LEADER_LOCK", os.getenv("DEALS_DB_PATH", "deals.db") + ".leader"))
+
+# Background refresh: entries are re-scraped before they expire, and stale
+# entries are served as-is while a refresh runs
+refresh_scheduler = RefreshScheduler(
+    scrapers.keys(),
+    refresh=refresh_platform,
+    get_timestamp=cache_timestamp.get,
+    ttl=CACHE_TTL,
+    refresh_ahead=int(os.getenv("DEALS_REFRESH_AHEAD", "60")),
+    leader=scrape_leader
+)
+
+def cache_max_age(platforms: Iterable[str]) -> int:
+    """Seconds until the oldest of the platforms' cache entries expires"""
+    now = datetime.now()
+    remaining = CACHE_TTL
+    for platform in platforms:
+        timestamp = cache_timestamp.get(platform)
+        if timestamp is None:
+            return 0
+        remaining = min(remaining, CACHE_TTL - (now - timestamp).total_seconds())
+    return max(0, int(remaining))
+
+def conditional_response(request: Request, snapshot: DealSnapshot, etag: str, max_age: int,
+                         body: Callable[[], Union[EncodedBody, Dict[str, Any]]],
+                         encoded: bool = True) -> Response:
+    """Answer If-None-Match with 304, otherwise send the body.
+    
+    ``encoded`` says whether ``body`` returns a pre-encoded EncodedBody
+    (served in the client's preferred coding) or a dict (sent as plain
+    JSON); the 304 carries the ETag of the variant the 200 would send.
+    """
+    encoding = choose_encoding(request.headers.get("accept-encoding")) if encoded else "identity"
+    headers = {
+        "Cache-Control": f"public, max-age={max_age}",
+        "X-Snapshot-Version": snapshot.version_token,
+        "ETag": variant_etag(etag, encoding),
+        "Vary": "Accept-Encoding"
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    content = body()
+    if isinstance(content, EncodedBody):
+        payload = content.get(encoding)
+    else:
+        payload = dumps_json(content)
+    
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+def platform_chunk(snapshot: DealSnapshot, platform: str) -> bytes:
+    """One NDJSON line of /deals/stream: the platform's slice of the merged /deals view"""
+    return dumps_json({
+        "platform": platform,
+        "deals": snapshot.platform_deals.get(platform, ()),
+        "stale": not is_cache_fresh(platform)
+    }) + b"\n"
+
+# /deals/stream, /deals/changes and /deals/events are declared before
+# /deals/{platform} so their names are not taken for platforms
+@app.get("/deals/stream")
+async def stream_deals(wait: float = Query(STREAM_WAIT, ge=0, le=60)):
+    """Deals as NDJSON, one line per platform as soon as it has scraped deals.
+    
+    Each line holds the same (sample-merged, deduplicated) deals /deals
+    serves for that platform. Platforms already in the cache are written
+    immediately; never-scraped ones are written when their first scrape
+    lands, or with whatever sample deals they have once ``wait`` seconds pass.
+    """
+    async def generate():
+        pending = set()
+        async with deal_updates.subscribe() as updates:
+            snapshot = deals_snapshot
+            for platform in scrapers:
+                if platform in deals_cache:
+                    yield platform_chunk(snapshot, platform)
+                    if not is_cache_fresh(platform):
+                        refresh_scheduler.request_refresh(platform)
+                else:
+                    pending.add(platform)
+                    refresh_scheduler.request_refresh(platform)
+            
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + wait
+            while pending:
+                try:
+                    update = await asyncio.wait_for(updates.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if update is None:
+                    break
+                snapshot = deals_snapshot
+                for platform in update["platforms"]:
+                    if platform in pending and platform in deals_cache:
+                        pending.discard(platform)
+                        yield platform_chunk(snapshot, platform)
+        
+        snapshot = deals_snapshot
+        for platform in scrapers:
+            if platform in pending:
+                yield platform_chunk(snapshot, platform)
+        yield dumps_json({"done": True, "version": snapshot.version_token}) + b"\n"
+    
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-store"}
+    )
+
+@app.get("/deals/changes")
+async def get_deal_changes(since: str = Query(..., min_length=1)):
+    """Deals added, changed and removed since a snapshot version token.
+    
+    Apply ``added``/``changed`` as upserts by ID and ``removed`` as
+    deletes, then poll again with ``since=<version>``. If ``since`` is
+    older than the changelog, newer than the current snapshot or from
+    another epoch (the store was reset), the full list comes back with
+    ``full: true``.
+    """
+    snapshot = deals_snapshot
+    version = parse_version(since, snapshot.epoch)
+    changes = changelog.since(version, snapshot.version) if version is not None else None
+    if changes is None:
+        return Response(
+            content=dumps_json({"full": True, "version": snapshot.version_token, "deals": snapshot.deals}),
+            media_type="application/json"
+        )
+    return {"full": False, **client_diff(changes, snapshot.epoch)}
+
+@app.get("/deals/events")
+async def deal_events(request: Request):
+    """Server-Sent Events: a ``deals`` event with added/changed/removed deals per refresh
+    
+    Idle connections cost a parked coroutine and a keepalive comment. A
+    client reconnecting with a Last-Event-ID is caught up from the
+    changelog, or sent a ``resync`` event (reload the full list) if that
+    version is no longer in it or belongs to another epoch.
+    """
+    last_event_id = request.headers.get("last-event-id")
+    
+    async def generate():
+        async with deal_updates.subscribe() as updates:
+            yield b"retry: 5000\n\n"
+            snapshot = deals_snapshot
+            token = snapshot.version_token
+            if last_event_id is not None and last_event_id != token:
+                version = parse_version(last_event_id, snapshot.epoch)
+                missed = changelog.since(version, snapshot.version) if version is not None else None
+                if missed is None:
+                    yield sse_event("resync", dumps_json({"version": token}), event_id=token)
+                elif missed["added"] or missed["changed"] or missed["removed"]:
+                    yield sse_event("deals", dumps_json(client_diff(missed, snapshot.epoch)),
+                                    event_id=token)
+            
+            while True:
+                try:
+                    update = await asyncio.wait_for(updates.get(), EVENTS_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield b": keepalive\n\n"
+                    continue
+                if update is None:
+                    # Fell too far behind; the browser reconnects and resyncs
+                    break
+                if update["event"] is not None:
+                    yield update["event"]
+    
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/deals/{platform}")
-async def get_platform_deals(platform: str):
+async def get_platform_deals(platform: str, request: Request):
     """Get deals from a specific platform"""
     if platform not in scrapers:
         raise HTTPException(status_code=404, detail="Platform not supported")
     
-    # Check cache freshness (5 minutes)
-    current_time = datetime.now()
-    if (platform in cache_timestamp and 
-        (current_time - cache_timestamp[platform]).total_seconds() < 300 and
-        platform in deals_cache):
-        return {"platform": platform, "deals": deals_cache[platform]}
+    fresh = is_cache_fresh(platform)
+    if not fresh:
+        refresh_scheduler.request_refresh(platform)
     
-    try:
-        scraper = scrapers[platform]
-        deals = await scrape_platform_async(platform, scraper)
-        
-        # Update cache
-        deals_cache[platform] = deals
-        cache_timestamp[platform] = current_time
-        
-        return {"platform": platform, "deals": deals}
-        
-    except Exception as e:
-        logger.error(f"Error fetching deals for {platform}: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch {platform} deals")
+    # Serve whatever we have; never wait on a scrape
+    snapshot = deals_snapshot
+    etag = snapshot.cached_etags[platform]
+    if not fresh:
+        etag = etag[:-1] + '-stale"'
+    return conditional_response(
+        request, snapshot, etag, cache_max_age([platform]),
+        lambda: snapshot.platform_body(platform, not fresh)
+    )
+
+@app.get("/deals/{deal_id}/history")
+async def get_deal_history(
+    deal_id: str,
+    days: Optional[float] = Query(None, gt=0),
+    start: Optional[float] = None,
+    end: Optional[float] = None
+):
+    """Price history of a deal; the range is unix seconds or the last ``days`` (default 30)"""
+    if start is None:
+        start = (end or time.time()) - (days or 30) * 86400
+    history = await asyncio.to_thread(price_history.query, deal_id, start, end)
+    if history is None:
+        raise HTTPException(status_code=404, detail="No price history for this deal")
+    return history
 
 @app.get("/deals")
-async def get_all_deals():
-    """Get deals from all platforms"""
-    all_deals = []
+async def get_all_deals(
+    request: Request,
+    platform: Optional[str] = None,
+    min_discount: Optional[float] = Query(None, ge=0, le=100),
+    max_price: Optional[float] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """Get deals from all platforms, optionally filtered and paginated"""
+    # Stale or missing entries are refreshed in the background
+    for name in scrapers:
+        if not is_cache_fresh(name):
+            refresh_scheduler.request_refresh(name)
     
-    # First, add sample deals to ensure immediate display
-    for platform, platform_deals in sample_deals.items():
-        for deal in platform_deals:
-            deal_copy = deal.copy()
-            deal_copy["platform"] = platform
-            all_deals.append(deal_copy)
+    snapshot = deals_snapshot
+    max_age = cache_max_age(scrapers)
+    if (platform is None and min_discount is None and max_price is None and
+            limit is None and cursor is None and fields is None):
+        return conditional_response(request, snapshot, snapshot.etag, max_age, lambda: snapshot.body)
     
-    # Create tasks for concurrent scraping
-    tasks = []
-    platforms_to_scrape = []
+    if platform is not None and platform not in scrapers:
+        raise HTTPException(status_code=404, detail="Platform not supported")
     
-    for platform, scraper in scrapers.items():
-        # Check cache first
-        current_time = datetime.now()
-        if (platform in cache_timestamp and 
-            (current_time - cache_timestamp[platform]).total_seconds() < 300 and
-            platform in deals_cache):
-            # Use cached data
-            for deal in deals_cache[platform]:
-                deal_copy = deal.copy()
-                deal_copy["platform"] = platform
-                all_deals.append(deal_copy)
-        else:
-            # Create scraping task
-            tasks.append(scrape_platform_async(platform, scraper))
-            platforms_to_scrape.append(platform)
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     
-    # Execute scraping tasks
-    if tasks:
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Error scraping {platforms_to_scrape[i]}: {str(result)}")
-                continue
-            
-            platform = platforms_to_scrape[i]
-            deals = result if result else []
-            
-            # Update cache
-            deals_cache[platform] = deals
-            cache_timestamp[platform] = datetime.now()
-            
-            # Add platform info and append to all_deals
-            for deal in deals:
-                deal_copy = deal.copy()
-                deal_copy["platform"] = platform
-                all_deals.append(deal_copy)
+    # A filtered page only changes when the snapshot or the query does
+    etag = compute_etag([snapshot.etag, str(request.query_params)])
     
-    # Remove duplicates and sort by discount percentage
-    seen_titles = set()
-    unique_deals = []
-    for deal in all_deals:
-        title_key = f"{deal['platform']}_{deal['title'][:50]}"
-        if title_key not in seen_titles:
-            seen_titles.add(title_key)
-            unique_deals.append(deal)
+    def render() -> Dict[str, Any]:
+        deals, total_count, next_key = snapshot.query(
+            platform=platform,
+            min_discount=min_discount,
+            max_price=max_price,
+            after=after,
+            limit=limit
+        )
+        field_names = [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+        return {
+            "deals": [project(deal, field_names) for deal in deals],
+            "total_count": total_count,
+            "next_cursor": encode_cursor(next_key) if next_key else None
+        }
     
-    unique_deals.sort(key=lambda x: float(x.get("discount_percentage", 0)), reverse=True)
+    return conditional_response(request, snapshot, etag, max_age, render, encoded=False)
+
+@app.get("/search")
+async def search_deals(
+    q: str = Query(..., min_length=1, max_length=200),
+    platform: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Search cached deal titles, ranked by relevance and discount"""
+    if platform is not None and platform not in scrapers:
+        raise HTTPException(status_code=404, detail="Platform not supported")
+    deals, total_count = search_index.search(q, platform=platform, limit=limit)
+    return {"query": q, "deals": deals, "total_count": total_count}
+
+@app.get("/compare/{deal_id}")
+async def compare_deal(deal_id: str):
+    """The same product on other platforms, with the cheapest listing"""
+    deal = product_matcher.get(deal_id)
+    if deal is None:
+        raise HTTPException(status_code=404, detail="Deal not found")
     
-    return {"deals": unique_deals, "total_count": len(unique_deals)}
+    matches = [{**other, "similarity": similarity} for other, similarity in product_matcher.matches(deal_id)]
+    priced = [d for d in [deal] + matches if parse_price(d.get("current_price", "")) is not None]
+    cheapest = min(priced, key=lambda d: parse_price(d["current_price"]), default=None)
+    return {
+        "deal": deal,
+        "matches": matches,
+        "cheapest_id": cheapest["id"] if cheapest else None
+    }
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "pid": os.getpid(),
+        "scrape_leader": refresh_scheduler.is_leader,
+        "scrape_executor": scrape_executor.stats(),
+        "scrapes": {"started": scrape_flight.started, "coalesced": scrape_flight.coalesced},
+        "upstream_not_modified": fetcher.not_modified
+    }
+
+@app.get("/stats/selectors")
+async def selector_stats():
+    """Per-platform selector hit rates, including selectors that never match"""
+    return {
+        platform: {
+            "parser": scraper.parser,
+            "parser_fallbacks": scraper.parser_fallbacks,
+            "unchanged_pages": scraper.unchanged_pages,
+            "fields": scraper.selector_stats()
+        }
+        for platform, scraper in scrapers.items()
+    }
 
 if __name__ == "__main__":
     import uvicorn
@@ -5,6 +5,10 @@ Deal aggregator scrapers package
 __version__ = "1.0.0"
 __author__ = "Deal Aggregator"
 
+from .base import BaseScraper
+from .executor import ScrapeExecutor, ExecutorSaturatedError
+from .fetch import AsyncFetcher, FetchResult
+from .http_cache import HTTPCache
 from .flipkart import FlipkartScraper
 from .amazon import AmazonScraper
 from .jiomart import JioMartScraper
@@ -13,6 +17,12 @@ from .swiggy import SwiggyInstatmartScraper
 from .bigbasket import BigBasketScraper
 
 __all__ = [
+    "BaseScraper",
+    "AsyncFetcher",
+    "FetchResult",
+    "HTTPCache",
+    "ScrapeExecutor",
+    "ExecutorSaturatedError",
     "FlipkartScraper",
     "AmazonScraper", 
     "JioMartScraper",
@@ -0,0 +1,375 @@
+from bs4 import BeautifulSoup
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import os
+import random
+from typing import List, Dict, Any, Optional, Callable, Tuple
+import re
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from .executor import ScrapeExecutor
+from .fetch import AsyncFetcher
+from .selectors import SelectorCascade, merge_selector_stats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive'
+}
+
+# BeautifulSoup tree builders, fastest first
+PARSER_BACKENDS = ["lxml", "html5lib", "html.parser"]
+FALLBACK_PARSER = "html.parser"
+
+def select_parser(preferred: Optional[str] = None) -> str:
+    """Pick the BeautifulSoup backend to use.
+
+    Tries ``preferred``, then the ``SCRAPER_HTML_PARSER`` environment
+    variable, then the fastest installed backend.
+    """
+    candidates = [preferred, os.getenv("SCRAPER_HTML_PARSER")] + PARSER_BACKENDS
+    for name in candidates:
+        if not name:
+            continue
+        if name not in PARSER_BACKENDS:
+            logger.warning(f"Unknown HTML parser backend {name!r}, ignoring")
+            continue
+        if name == "html.parser" or importlib.util.find_spec(name) is not None:
+            return name
+        logger.warning(f"HTML parser backend {name!r} is not installed, ignoring")
+    return FALLBACK_PARSER
+
+# Query parameters that track how a product was reached, not which product it is
+TRACKING_PARAMS = {
+    "ref", "ref_", "refrid", "lid", "marketplace", "store", "srno", "otracker", "otracker1",
+    "fm", "iid", "ppt", "ppn", "ssid", "sid", "spotlighttagid", "cmpid", "affid", "affextparam1",
+    "affextparam2", "tag", "linkcode", "ascsubtag", "camp", "creative", "creativeasin", "qid",
+    "sr", "srs", "sprefix", "crid", "keywords", "k", "q", "dib", "dib_tag", "th", "psc",
+    "smid", "content-id", "sp_csd", "spla", "gclid", "fbclid", "_encoding", "ie", "rnid",
+    "source", "src", "from", "trackid", "sku_src",
+}
+# utm_source..., Amazon placement (pf_rd_*, pd_rd_*) and ad-click (hvadid, hvpos...) params
+TRACKING_PARAM_PREFIXES = ("utm_", "pf_rd_", "pd_rd_", "hv")
+
+# Ad and redirect endpoints that carry the real product URL in a parameter
+REDIRECT_PATHS = {"/sspa/click": "url", "/gp/slredirect/picassoredirect.html": "url"}
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+def normalize_product_url(url: str) -> str:
+    """Canonical form of a product URL for identity purposes.
+
+    Unwraps ad redirects (Amazon's ``/sspa/click?url=...``), drops the
+    fragment, tracking path segments (``/ref=...``) and known tracking
+    query parameters, keeps identifying ones (``pid``, ``asin``, ...) in
+    sorted order, lowercases the host and strips trailing slashes.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    params = parse_qsl(parts.query, keep_blank_values=True)
+
+    target_param = REDIRECT_PATHS.get(parts.path.rstrip("/").lower())
+    if target_param is not None:
+        target = dict(params).get(target_param)
+        if target:
+            return normalize_product_url(urljoin(urlunsplit((parts.scheme, parts.netloc, "/", "", "")), target))
+
+    segments = [seg for seg in parts.path.split("/") if seg and not seg.startswith("ref=")]
+    path = "/" + "/".join(segments)
+    query = urlencode(sorted((k, v) for k, v in params if not _is_tracking_param(k)))
+    return urlunsplit((parts.scheme.lower() or "https", parts.netloc.lower(), path, query, ""))
+
+# Markup the selectors never look at, as (opener, closer) pairs; skipped when
+# fingerprinting a page because it carries per-request noise (nonces, tokens,
+# tracking state)
+VOLATILE_BLOCKS = ((b"<script", b"</script"), (b"<style", b"</style"), (b"<!--", b"-->"))
+_TAG_NAME_END = frozenset(b" \t\r\n/>")
+
+def page_fingerprint(content: bytes) -> str:
+    """Digest of the parts of a page that deal extraction depends on.
+
+    A single forward scan: each opener's next position is searched for
+    only once it has been passed, so pages with many (even unterminated)
+    script tags stay linear. An unterminated block runs to the end.
+    """
+    lowered = content.lower()
+    digest = hashlib.blake2b(digest_size=16)
+    next_open = [lowered.find(opener) for opener, _ in VOLATILE_BLOCKS]
+    pos = 0
+    while True:
+        for i, (opener, _) in enumerate(VOLATILE_BLOCKS):
+            while next_open[i] != -1 and next_open[i] < pos:
+                next_open[i] = lowered.find(opener, pos)
+        candidates = [(at, i) for i, at in enumerate(next_open) if at != -1]
+        if not candidates:
+            digest.update(content[pos:])
+            break
+
+        start, i = min(candidates)
+        opener, closer = VOLATILE_BLOCKS[i]
+        after = start + len(opener)
+        if opener != b"<!--" and after < len(lowered) and lowered[after] not in _TAG_NAME_END:
+            # e.g. <scripts>: not a script tag, keep it
+            digest.update(content[pos:after])
+            pos = after
+            continue
+
+        digest.update(content[pos:start])
+        end = lowered.find(closer, after)
+        if end == -1:
+            break
+        end += len(closer)
+        if closer != b"-->":
+            close_tag_end = lowered.find(b">", end)
+            end = len(lowered) if close_tag_end == -1 else close_tag_end + 1
+        pos = end
+    return digest.hexdigest()
+
+def normalize_title(title: str) -> str:
+    """Lowercased title with punctuation and repeated whitespace removed"""
+    return " ".join(re.sub(r"[^\w\s]", " ", title.lower()).split())
+
+class BaseScraper:
+    """Shared fetch/parse plumbing for the platform scrapers.
+
+    Subclasses provide the platform details, their deal URLs, the
+    selector lists for each field and ``_extract_deal_info``. Selector
+    lists are tried through a per-page ``SelectorCascade``: the product
+    container selector that matched last on a page is probed first, while
+    field selectors keep their declared priority.
+    """
+
+    platform = ""
+    name = ""
+    base_url = ""
+    timeout = 15
+    # Politeness budget: seconds between request starts against this host
+    request_spacing = (0.5, 1.0)
+    product_selectors: List[str] = []
+    title_selectors: List[str] = []
+    price_selectors: List[str] = []
+    original_price_selectors: List[str] = []
+    url_selectors: List[str] = []
+    img_selectors: List[str] = ['img[src]']
+    extra_headers: Dict[str, str] = {}
+    # Re-parse with this backend when the main one finds no product containers
+    fallback_parser: Optional[str] = FALLBACK_PARSER
+
+    def __init__(self, parser: Optional[str] = None):
+        self.headers = {**DEFAULT_HEADERS, **self.extra_headers}
+        self.parser = select_parser(parser)
+        self.parser_fallbacks = 0
+        self.unchanged_pages = 0
+        self._cascades: Dict[Tuple[str, str], SelectorCascade] = {}
+        # page URL -> (fingerprint, deals extracted from it)
+        self._page_results: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
+
+    def _get_deal_urls(self) -> List[str]:
+        """URLs to scrape deals from"""
+        raise NotImplementedError
+
+    def get_deals(self) -> List[Dict[str, Any]]:
+        """Blocking wrapper around get_deals_async for scripts and threads"""
+        async def run():
+            fetcher = AsyncFetcher()
+            try:
+                return await self.get_deals_async(fetcher)
+            finally:
+                await fetcher.close()
+
+        return asyncio.run(run())
+
+    async def get_deals_async(self, fetcher: AsyncFetcher,
+                              executor: Optional[ScrapeExecutor] = None) -> List[Dict[str, Any]]:
+        """Scrape all deal URLs concurrently using the shared async fetcher.
+
+        Requests against the platform are spaced by ``request_spacing``
+        rather than run back to back, so a cold scrape costs roughly one page
+        fetch. Page parsing is CPU-bound, so it is handed to ``executor`` (or
+        a worker thread) to keep the event loop responsive.
+        """
+        urls = self._get_deal_urls()
+        results = await asyncio.gather(
+            *(self._scrape_deals_page_async(fetcher, url, executor) for url in urls),
+            return_exceptions=True
+        )
+
+        deals = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping {self.name} URL {url}: {str(result)}")
+                continue
+            deals.extend(result)
+
+        return deals[:20]  # Return top 20 deals
+
+    async def _scrape_deals_page_async(self, fetcher: AsyncFetcher, url: str,
+                                       executor: Optional[ScrapeExecutor] = None) -> List[Dict[str, Any]]:
+        """Fetch a page asynchronously and parse it off the event loop.
+
+        Parsing is skipped for a 304 whose deals were already extracted, and
+        for a page whose fingerprint matches the last parsed copy.
+        """
+        try:
+            result = await fetcher.fetch(
+                url,
+                headers=self.headers,
+                timeout=self.timeout,
+                min_interval=random.uniform(*self.request_spacing)
+            )
+        except Exception as e:
+            logger.error(f"Error scraping {self.name} page {url}: {str(e)}")
+            return []
+
+        if result.not_modified and result.deals is not None:
+            logger.debug(f"{self.name} page {url} not modified, reusing {len(result.deals)} deals")
+            return result.deals
+
+        # Hashing is CPU work on the whole page, so it runs in the parse job
+        previous = self._page_results.get(url)
+        previous_fingerprint = previous[0] if previous is not None else None
+        if executor is None:
+            fingerprint, deals = await asyncio.to_thread(
+                self._parse_if_changed, result.body, url, previous_fingerprint
+            )
+        else:
+            fingerprint, deals = await executor.parse(self, result.body, url, previous_fingerprint)
+
+        if deals is None:
+            self.unchanged_pages += 1
+            deals = previous[1]
+        else:
+            self._page_results[url] = (fingerprint, deals)
+
+        await asyncio.to_thread(fetcher.remember_deals, url, deals)
+        return deals
+
+    def _parse_if_changed(self, content: bytes, url: str,
+                          previous_fingerprint: Optional[str]) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+        """Fingerprint a page and parse it unless it matches ``previous_fingerprint``.
+
+        Returns the fingerprint and the extracted deals, or None for the
+        deals when the page is unchanged.
+        """
+        fingerprint = page_fingerprint(content)
+        if fingerprint == previous_fingerprint:
+            return fingerprint, None
+        return fingerprint, self._parse_deals_page(content, url)
+
+    def _parse_deals_page(self, content: bytes, url: str) -> List[Dict[str, Any]]:
+        """Extract deals from a fetched page body"""
+        deals = []
+
+        try:
+            products = self._find_products(BeautifulSoup(content, self.parser), url)
+
+            # Fast parsers can build a different tree for broken markup
+            if not products and self.fallback_parser and self.fallback_parser != self.parser:
+                products = self._find_products(BeautifulSoup(content, self.fallback_parser), url)
+                if products:
+                    self.parser_fallbacks += 1
+                    logger.debug(f"{self.name} page {url} needed the {self.fallback_parser} fallback")
+
+            for product in products[:10]:  # Limit to 10 per page
+                try:
+                    deal = self._extract_deal_info(product, url)
+                    if deal and self._is_valid_deal(deal):
+                        deals.append(deal)
+                except Exception as e:
+                    logger.debug(f"Error extracting deal info: {str(e)}")
+                    continue
+
+        except Exception as e:
+            logger.error(f"Error parsing {self.name} page {url}: {str(e)}")
+
+        return deals
+
+    def _find_products(self, soup: BeautifulSoup, page_url: str) -> list:
+        """Look for product containers"""
+        return self._cascade("product", page_url).select(soup)
+
+    def _cascade(self, field: str, page_url: str) -> SelectorCascade:
+        """Selector cascade for a field on a given page.
+
+        Only the product container lookup memoizes its last hit; per-product
+        fields always try their selectors in declared priority order.
+        """
+        key = (page_url, field)
+        cascade = self._cascades.get(key)
+        if cascade is None:
+            cascade = self._cascades.setdefault(
+                key, SelectorCascade(getattr(self, f"{field}_selectors"), memoize=(field == "product"))
+            )
+        return cascade
+
+    def _select_one(self, element, field: str, page_url: str,
+                    accept: Optional[Callable[[Any], Any]] = None):
+        """First element for a field, in the field's selector priority order"""
+        return self._cascade(field, page_url).select_one(element, accept)
+
+    def selector_stats(self) -> Dict[str, Any]:
+        """Hit/miss counts per field and selector, plus never-matching selectors.
+
+        Counts cover parsing done in this process; with the process-pool
+        parse stage each worker process keeps its own counts.
+        """
+        by_field: Dict[str, List[SelectorCascade]] = {}
+        for (_, field), cascade in list(self._cascades.items()):
+            by_field.setdefault(field, []).append(cascade)
+
+        stats = {}
+        for field, cascades in by_field.items():
+            selectors = merge_selector_stats(cascades)
+            stats[field] = {
+                "selectors": selectors,
+                "dead": [sel for sel, c in selectors.items() if c["hits"] == 0 and c["misses"] > 0]
+            }
+        return stats
+
+    def _extract_deal_info(self, product_element, base_url: str) -> Optional[Dict[str, Any]]:
+        """Extract deal information from product element"""
+        raise NotImplementedError
+
+    def _extract_image_url(self, product_element, page_url: str = "") -> str:
+        """Extract product image URL"""
+        img_elem = self._select_one(product_element, "img", page_url, accept=lambda e: e.get('src'))
+        return img_elem.get('src') if img_elem else ""
+
+    def _calculate_discount(self, current_price: str, original_price: str) -> float:
+        """Calculate discount percentage"""
+        try:
+            # Extract numeric values from price strings
+            current = float(re.sub(r'[^\d.]', '', current_price))
+            original = float(re.sub(r'[^\d.]', '', original_price))
+
+            if original > current > 0:
+                return round(((original - current) / original) * 100, 2)
+        except (ValueError, ZeroDivisionError):
+            pass
+        return 0.0
+
+    def _generate_deal_id(self, url: str, title: str) -> str:
+        """Generate a stable deal ID from the product URL (or title).
+
+        Uses a truncated BLAKE2 digest rather than ``hash()``, so the same
+        product gets the same ID in every worker and across restarts.
+        """
+        key = normalize_product_url(url) or normalize_title(title)
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+        return f"{self.platform}_{digest}"
+
+    def _is_valid_deal(self, deal: Dict[str, Any]) -> bool:
+        """Validate if deal has required information"""
+        return (deal.get("title") and
+                deal.get("current_price") and
+                deal.get("url") and
+                len(deal.get("title", "")) > 5)
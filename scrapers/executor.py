@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Scraper instances owned by a parse worker process, one per scraper class
+_worker_scrapers: Dict[type, Any] = {}
+
+def parse_page(scraper_cls: type, parser: str, content: bytes, url: str,
+               previous_fingerprint: Optional[str] = None) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+    """Process-pool entry point: fingerprint and parse a page, returning only the deal dicts"""
+    scraper = _worker_scrapers.get(scraper_cls)
+    if scraper is None:
+        scraper = _worker_scrapers[scraper_cls] = scraper_cls(parser=parser)
+    return scraper._parse_if_changed(content, url, previous_fingerprint)
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when the scrape executor's queue is full"""
+
+class ScrapeExecutor:
+    """Application-scoped, bounded thread pool for blocking scrape work.
+
+    ``max_workers`` threads are created once and reused for every scrape.
+    At most ``max_queue`` jobs may be pending (queued or running) at once;
+    further submissions are rejected instead of piling up. Each platform
+    may occupy at most ``platform_slots`` workers, so one slow platform
+    can't starve the others.
+
+    With ``parse_processes`` > 0, HTML parsing runs in a process pool
+    instead: raw page bytes go out and only the extracted deal dicts come
+    back, so parsing several platforms scales across cores rather than
+    serializing on the GIL.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 32, platform_slots: int = 2,
+                 parse_processes: int = 0):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.platform_slots = platform_slots
+        self.parse_processes = parse_processes
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape")
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        if parse_processes > 0:
+            # spawn: forking a process that runs an event loop and threads is unsafe
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=parse_processes,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        self._platform_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._platform_active: Dict[str, int] = {}
+        self._pending = 0
+        self._active = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _semaphore(self, platform: str) -> asyncio.Semaphore:
+        if platform not in self._platform_semaphores:
+            self._platform_semaphores[platform] = asyncio.Semaphore(self.platform_slots)
+        return self._platform_semaphores[platform]
+
+    async def parse(self, scraper, content: bytes, url: str,
+                    previous_fingerprint: Optional[str] = None) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+        """Fingerprint and parse a fetched page on the process pool if enabled, else a thread.
+
+        Returns the page fingerprint and its deals, or None for the deals
+        if the fingerprint equals ``previous_fingerprint``.
+        """
+        if self._parse_pool is not None:
+            return await self._submit(self._parse_pool, scraper.platform, parse_page,
+                                      type(scraper), scraper.parser, content, url, previous_fingerprint)
+        return await self.run(scraper.platform, scraper._parse_if_changed, content, url, previous_fingerprint)
+
+    async def run(self, platform: str, fn: Callable[..., Any], *args) -> Any:
+        """Run ``fn(*args)`` on the thread pool within the platform's slots"""
+        return await self._submit(self._pool, platform, fn, *args)
+
+    async def _submit(self, pool: Executor, platform: str, fn: Callable[..., Any], *args) -> Any:
+        if self._pending >= self.max_queue:
+            self.rejected += 1
+            logger.warning(
+                f"Scrape executor saturated ({self._pending} pending), rejecting {platform} job"
+            )
+            raise ExecutorSaturatedError(f"Scrape executor queue full ({self.max_queue})")
+
+        self._pending += 1
+        try:
+            async with self._semaphore(platform):
+                self._active += 1
+                self._platform_active[platform] = self._platform_active.get(platform, 0) + 1
+                try:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(pool, fn, *args)
+                finally:
+                    self._active -= 1
+                    self._platform_active[platform] -= 1
+                    self.completed += 1
+        finally:
+            self._pending -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Current load, for operators"""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "platform_slots": self.platform_slots,
+            "parse_processes": self.parse_processes,
+            "active": self._active,
+            "queued": self._pending - self._active,
+            "saturated": self._pending >= self.max_queue,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "active_by_platform": {k: v for k, v in self._platform_active.items() if v}
+        }
+
+    def shutdown(self):
+        """Stop the worker threads and parse processes"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,111 @@
+import aiohttp
+import asyncio
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional
+from urllib.parse import urlparse
+
+from .http_cache import HTTPCache
+
+logger = logging.getLogger(__name__)
+
+class FetchResult(NamedTuple):
+    body: bytes
+    # True when the server answered 304 and ``body`` came from the cache
+    not_modified: bool = False
+    # Deals previously extracted from an unchanged cached body
+    deals: Optional[List[Dict[str, Any]]] = None
+
+class AsyncFetcher:
+    """Pooled asyncio HTTP client shared by all scrapers.
+
+    One aiohttp session (and therefore one connection pool) serves every
+    platform; ``limit_per_host`` caps how many sockets we hold open against
+    a single retailer at once, and ``min_interval`` spaces out request
+    starts against the same host. With an ``HTTPCache``, ``fetch`` sends
+    conditional GETs and answers 304s from disk.
+    """
+
+    def __init__(self, limit: int = 30, limit_per_host: int = 4, timeout: float = 15,
+                 cache: Optional[HTTPCache] = None):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.cache = cache
+        self.not_modified = 0
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session lazily inside the running loop"""
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=300
+                )
+                self._session = aiohttp.ClientSession(connector=connector)
+            return self._session
+
+    async def _wait_for_slot(self, host: str, min_interval: float):
+        """Reserve the next start slot for a host and sleep until it opens"""
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_slot.get(host, 0.0))
+        self._next_slot[host] = start + min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+                  timeout: Optional[float] = None, min_interval: float = 0) -> bytes:
+        """Fetch a URL and return the raw response body"""
+        if min_interval > 0:
+            await self._wait_for_slot(urlparse(url).netloc, min_interval)
+
+        session = await self._get_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        async with session.get(url, headers=headers, timeout=client_timeout) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None,
+                    timeout: Optional[float] = None, min_interval: float = 0) -> FetchResult:
+        """Fetch a URL, revalidating against the on-disk cache when possible"""
+        if self.cache is None:
+            return FetchResult(await self.get(url, headers, timeout, min_interval))
+
+        cached = await asyncio.to_thread(self.cache.lookup, url)
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        if min_interval > 0:
+            await self._wait_for_slot(urlparse(url).netloc, min_interval)
+
+        session = await self._get_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        async with session.get(url, headers=request_headers, timeout=client_timeout) as response:
+            if response.status == 304 and cached is not None:
+                self.not_modified += 1
+                return FetchResult(cached.body, True, cached.deals)
+            response.raise_for_status()
+            body = await response.read()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        await asyncio.to_thread(self.cache.store, url, body, etag, last_modified)
+        return FetchResult(body)
+
+    def remember_deals(self, url: str, deals: List[Dict[str, Any]]):
+        """Keep the deals extracted from a cached page for its next 304"""
+        if self.cache is not None:
+            self.cache.store_deals(url, deals)
+
+    async def close(self):
+        """Close the pooled session and its connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+class CachedResponse(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    # Deals extracted from ``body``, if the scraper has recorded them
+    deals: Optional[List[Dict[str, Any]]]
+
+class HTTPCache:
+    """On-disk cache of upstream pages keyed by URL.
+
+    Only responses carrying an ETag or Last-Modified are kept, since only
+    those can be revalidated. Next to the body we keep the deals the
+    scraper extracted from it, so a 304 answer needs no parsing at all.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    def _write(self, path: str, data: bytes):
+        """Write via a temp file so readers never see a partial file"""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """The cached response for a URL, or None"""
+        try:
+            with open(self._path(url, "json"), "rb") as f:
+                meta = json.load(f)
+            with open(self._path(url, "body"), "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+
+        deals = None
+        try:
+            with open(self._path(url, "deals.json"), "rb") as f:
+                stored = json.load(f)
+            if stored.get("etag") == meta.get("etag") and stored.get("stored_at") == meta.get("stored_at"):
+                deals = stored["deals"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        return CachedResponse(meta.get("etag"), meta.get("last_modified"), body, deals)
+
+    def store(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]):
+        """Cache a 200 response if it has validators"""
+        if not etag and not last_modified:
+            # Forget any older entry so its deals are not paired with this body
+            try:
+                os.remove(self._path(url, "json"))
+            except OSError:
+                pass
+            return
+        meta = {"url": url, "etag": etag, "last_modified": last_modified, "stored_at": time.time()}
+        try:
+            self._write(self._path(url, "body"), body)
+            self._write(self._path(url, "json"), json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not cache response for {url}: {str(e)}")
+
+    def store_deals(self, url: str, deals: List[Dict[str, Any]]):
+        """Record the deals extracted from the currently cached body"""
+        try:
+            with open(self._path(url, "json"), "rb") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return
+        stored = {"etag": meta.get("etag"), "stored_at": meta.get("stored_at"), "deals": deals}
+        try:
+            self._write(self._path(url, "deals.json"), json.dumps(stored, ensure_ascii=False).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not cache deals for {url}: {str(e)}")
@@ -1,152 +1,94 @@
-import requests
-from bs4 import BeautifulSoup
 import logging
 import time
-import random
-from typing import List, Dict, Any
-import re
-from urllib.parse import urljoin, urlparse
+from typing import List, Dict, Any, Optional
+from urllib.parse import urljoin
+
+from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
-class JioMartScraper:
-    def __init__(self):
-        self.base_url = "https://www.jiomart.com"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        })
-        
-    def get_deals(self) -> List[Dict[str, Any]]:
-        """Scrape deals from JioMart"""
-        deals = []
-        
-        # URLs to scrape deals from
-        deal_urls = [
+class JioMartScraper(BaseScraper):
+    platform = "jiomart"
+    name = "JioMart"
+    base_url = "https://www.jiomart.com"
+    timeout = 10
+    request_spacing = (0.3, 0.8)
+
+    # Look for product containers
+    product_selectors = [
+        '.plp-card-container',
+        '.product-item',
+        '.jm-product-card',
+        '.product-card'
+    ]
+    title_selectors = [
+        '.plp-card-details-name',
+        '.product-title',
+        '.jm-heading-xs',
+        'a[title]'
+    ]
+    price_selectors = [
+        '.final-price',
+        '.jm-heading-xxs',
+        '.selling-price',
+        '.current-price'
+    ]
+    original_price_selectors = [
+        '.actual-price',
+        '.mrp-price',
+        '.original-price',
+        '.line-through'
+    ]
+    url_selectors = ['a[href]']
+    img_selectors = ['img[src]', '.product-image img']
+
+    def _get_deal_urls(self) -> List[str]:
+        """URLs to scrape deals from"""
+        return [
             f"{self.base_url}/c/groceries/fruits-vegetables/2",
             f"{self.base_url}/c/groceries/dairy-bakery/3",
             f"{self.base_url}/c/electronics/mobiles-tablets/12"
         ]
-        
-        for url in deal_urls:
-            try:
-                deals.extend(self._scrape_deals_page(url))
-                time.sleep(random.uniform(1, 3))  # Random delay
-            except Exception as e:
-                logger.error(f"Error scraping JioMart URL {url}: {str(e)}")
-                continue
-                
-        return deals[:20]  # Return top 20 deals
-    
-    def _scrape_deals_page(self, url: str) -> List[Dict[str, Any]]:
-        """Scrape deals from a specific JioMart page"""
-        deals = []
-        
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for product containers
-            product_selectors = [
-                '.plp-card-container',
-                '.product-item',
-                '.jm-product-card',
-                '.product-card'
-            ]
-            
-            products = []
-            for selector in product_selectors:
-                found_products = soup.select(selector)
-                if found_products:
-                    products = found_products
-                    break
-            
-            for product in products[:10]:  # Limit to 10 per page
-                try:
-                    deal = self._extract_deal_info(product, url)
-                    if deal and self._is_valid_deal(deal):
-                        deals.append(deal)
-                except Exception as e:
-                    logger.debug(f"Error extracting deal info: {str(e)}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error scraping JioMart page {url}: {str(e)}")
-            
-        return deals
-    
-    def _extract_deal_info(self, product_element, base_url: str) -> Dict[str, Any]:
+
+    def _extract_deal_info(self, product_element, base_url: str) -> Optional[Dict[str, Any]]:
         """Extract deal information from product element"""
         try:
             # Extract title
-            title_selectors = [
-                '.plp-card-details-name',
-                '.product-title',
-                '.jm-heading-xs',
-                'a[title]'
-            ]
+            title_elem = self._select_one(product_element, "title", base_url)
             title = ""
-            for selector in title_selectors:
-                title_elem = product_element.select_one(selector)
-                if title_elem:
-                    title = title_elem.get('title') or title_elem.get_text(strip=True)
-                    break
+            if title_elem:
+                title = title_elem.get('title') or title_elem.get_text(strip=True)
             
             if not title:
                 return None
             
             # Extract price
-            price_selectors = [
-                '.final-price',
-                '.jm-heading-xxs',
-                '.selling-price',
-                '.current-price'
-            ]
+            price_elem = self._select_one(product_element, "price", base_url)
             current_price = ""
-            for selector in price_selectors:
-                price_elem = product_element.select_one(selector)
-                if price_elem:
-                    current_price = price_elem.get_text(strip=True)
-                    break
+            if price_elem:
+                current_price = price_elem.get_text(strip=True)
             
             # Extract original price
-            original_price_selectors = [
-                '.actual-price',
-                '.mrp-price',
-                '.original-price',
-                '.line-through'
-            ]
+            orig_price_elem = self._select_one(product_element, "original_price", base_url)
             original_price = ""
-            for selector in original_price_selectors:
-                orig_price_elem = product_element.select_one(selector)
-                if orig_price_elem:
-                    original_price = orig_price_elem.get_text(strip=True)
-                    break
+            if orig_price_elem:
+                original_price = orig_price_elem.get_text(strip=True)
             
             # Extract product URL
-            url_selectors = ['a[href]']
+            url_elem = self._select_one(product_element, "url", base_url, accept=lambda e: e.get('href'))
             product_url = ""
-            for selector in url_selectors:
-                url_elem = product_element.select_one(selector)
-                if url_elem and url_elem.get('href'):
-                    href = url_elem.get('href')
-                    if href.startswith('/'):
-                        product_url = urljoin(self.base_url, href)
-                    else:
-                        product_url = href
-                    break
+            if url_elem:
+                href = url_elem.get('href')
+                if href.startswith('/'):
+                    product_url = urljoin(self.base_url, href)
+                else:
+                    product_url = href
             
             # Calculate discount percentage
             discount_percentage = self._calculate_discount(current_price, original_price)
             
             # Generate unique ID
-            deal_id = self._generate_deal_id(title, current_price)
+            deal_id = self._generate_deal_id(product_url, title)
             
             return {
                 "id": deal_id,
@@ -156,43 +98,10 @@ class JioMartScraper:
                 "discount_percentage": discount_percentage,
                 "url": product_url,
                 "platform": "jiomart",
-                "image_url": self._extract_image_url(product_element),
+                "image_url": self._extract_image_url(product_element, base_url),
                 "scraped_at": time.time()
             }
             
         except Exception as e:
             logger.debug(f"Error in _extract_deal_info: {str(e)}")
             return None
-    
-    def _extract_image_url(self, product_element) -> str:
-        """Extract product image URL"""
-        img_selectors = ['img[src]', '.product-image img']
-        for selector in img_selectors:
-            img_elem = product_element.select_one(selector)
-            if img_elem and img_elem.get('src'):
-                return img_elem.get('src')
-        return ""
-    
-    def _calculate_discount(self, current_price: str, original_price: str) -> float:
-        """Calculate discount percentage"""
-        try:
-            # Extract numeric values from price strings
-            current = float(re.sub(r'[^\d.]', '', current_price))
-            original = float(re.sub(r'[^\d.]', '', original_price))
-            
-            if original > current > 0:
-                return round(((original - current) / original) * 100, 2)
-        except (ValueError, ZeroDivisionError):
-            pass
-        return 0.0
-    
-    def _generate_deal_id(self, title: str, price: str) -> str:
-        """Generate unique deal ID"""
-        return f"jiomart_{hash(title + price) % 1000000}"
-    
-    def _is_valid_deal(self, deal: Dict[str, Any]) -> bool:
-        """Validate if deal has required information"""
-        return (deal.get("title") and 
-                deal.get("current_price") and 
-                deal.get("url") and
-                len(deal.get("title", "")) > 5)
@@ -1,152 +1,94 @@
-import requests
-from bs4 import BeautifulSoup
 import logging
 import time
-import random
-from typing import List, Dict, Any
-import re
-from urllib.parse import urljoin, urlparse
+from typing import List, Dict, Any, Optional
+from urllib.parse import urljoin
+
+from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
-class MyntraScraper:
-    def __init__(self):
-        self.base_url = "https://www.myntra.com"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        })
-        
-    def get_deals(self) -> List[Dict[str, Any]]:
-        """Scrape deals from Myntra"""
-        deals = []
-        
-        # URLs to scrape deals from
-        deal_urls = [
+class MyntraScraper(BaseScraper):
+    platform = "myntra"
+    name = "Myntra"
+    base_url = "https://www.myntra.com"
+    timeout = 15
+    request_spacing = (0.5, 1.0)
+
+    # Look for product containers
+    product_selectors = [
+        '.product-base',
+        '.product-productMetaInfo',
+        '.product-item',
+        '.product-card'
+    ]
+    title_selectors = [
+        '.product-product',
+        '.product-brand',
+        'h3',
+        'h4'
+    ]
+    price_selectors = [
+        '.product-discountedPrice',
+        '.product-strike',
+        '.current-price',
+        '.selling-price'
+    ]
+    original_price_selectors = [
+        '.product-strike',
+        '.product-actualPrice',
+        '.original-price',
+        '.mrp-price'
+    ]
+    url_selectors = ['a[href]']
+    img_selectors = ['img[src]', '.product-imageSlider img']
+
+    def _get_deal_urls(self) -> List[str]:
+        """URLs to scrape deals from"""
+        return [
             f"{self.base_url}/shop/men",
             f"{self.base_url}/shop/women",
             f"{self.base_url}/shop/kids"
         ]
-        
-        for url in deal_urls:
-            try:
-                deals.extend(self._scrape_deals_page(url))
-                time.sleep(random.uniform(2, 4))  # Random delay
-            except Exception as e:
-                logger.error(f"Error scraping Myntra URL {url}: {str(e)}")
-                continue
-                
-        return deals[:20]  # Return top 20 deals
-    
-    def _scrape_deals_page(self, url: str) -> List[Dict[str, Any]]:
-        """Scrape deals from a specific Myntra page"""
-        deals = []
-        
-        try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for product containers
-            product_selectors = [
-                '.product-base',
-                '.product-productMetaInfo',
-                '.product-item',
-                '.product-card'
-            ]
-            
-            products = []
-            for selector in product_selectors:
-                found_products = soup.select(selector)
-                if found_products:
-                    products = found_products
-                    break
-            
-            for product in products[:10]:  # Limit to 10 per page
-                try:
-                    deal = self._extract_deal_info(product, url)
-                    if deal and self._is_valid_deal(deal):
-                        deals.append(deal)
-                except Exception as e:
-                    logger.debug(f"Error extracting deal info: {str(e)}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error scraping Myntra page {url}: {str(e)}")
-            
-        return deals
-    
-    def _extract_deal_info(self, product_element, base_url: str) -> Dict[str, Any]:
+
+    def _extract_deal_info(self, product_element, base_url: str) -> Optional[Dict[str, Any]]:
         """Extract deal information from product element"""
         try:
             # Extract title
-            title_selectors = [
-                '.product-product',
-                '.product-brand',
-                'h3',
-                'h4'
-            ]
+            title_elem = self._select_one(product_element, "title", base_url)
             title = ""
-            for selector in title_selectors:
-                title_elem = product_element.select_one(selector)
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    break
+            if title_elem:
+                title = title_elem.get_text(strip=True)
             
             if not title:
                 return None
             
             # Extract price
-            price_selectors = [
-                '.product-discountedPrice',
-                '.product-strike',
-                '.current-price',
-                '.selling-price'
-            ]
+            price_elem = self._select_one(product_element, "price", base_url)
             current_price = ""
-            for selector in price_selectors:
-                price_elem = product_element.select_one(selector)
-                if price_elem:
-                    current_price = price_elem.get_text(strip=True)
-                    break
+            if price_elem:
+                current_price = price_elem.get_text(strip=True)
             
             # Extract original price
-            original_price_selectors = [
-                '.product-strike',
-                '.product-actualPrice',
-                '.original-price',
-                '.mrp-price'
-            ]
+            orig_price_elem = self._select_one(product_element, "original_price", base_url)
             original_price = ""
-            for selector in original_price_selectors:
-                orig_price_elem = product_element.select_one(selector)
-                if orig_price_elem:
-                    original_price = orig_price_elem.get_text(strip=True)
-                    break
+            if orig_price_elem:
+                original_price = orig_price_elem.get_text(strip=True)
             
             # Extract product URL
-            url_selectors = ['a[href]']
+            url_elem = self._select_one(product_element, "url", base_url, accept=lambda e: e.get('href'))
             product_url = ""
-            for selector in url_selectors:
-                url_elem = product_element.select_one(selector)
-                if url_elem and url_elem.get('href'):
-                    href = url_elem.get('href')
-                    if href.startswith('/'):
-                        product_url = urljoin(self.base_url, href)
-                    else:
-                        product_url = href
-                    break
+            if url_elem:
+                href = url_elem.get('href')
+                if href.startswith('/'):
+                    product_url = urljoin(self.base_url, href)
+                else:
+                    product_url = href
             
             # Calculate discount percentage
             discount_percentage = self._calculate_discount(current_price, original_price)
             
             # Generate unique ID
-            deal_id = self._generate_deal_id(title, current_price)
+            deal_id = self._generate_deal_id(product_url, title)
             
             return {
                 "id": deal_id,
@@ -156,43 +98,10 @@ class MyntraScraper:
                 "discount_percentage": discount_percentage,
                 "url": product_url,
                 "platform": "myntra",
-                "image_url": self._extract_image_url(product_element),
+                "image_url": self._extract_image_url(product_element, base_url),
                 "scraped_at": time.time()
             }
             
         except Exception as e:
             logger.debug(f"Error in _extract_deal_info: {str(e)}")
             return None
-    
-    def _extract_image_url(self, product_element) -> str:
-        """Extract product image URL"""
-        img_selectors = ['img[src]', '.product-imageSlider img']
-        for selector in img_selectors:
-            img_elem = product_element.select_one(selector)
-            if img_elem and img_elem.get('src'):
-                return img_elem.get('src')
-        return ""
-    
-    def _calculate_discount(self, current_price: str, original_price: str) -> float:
-        """Calculate discount percentage"""
-        try:
-            # Extract numeric values from price strings
-            current = float(re.sub(r'[^\d.]', '', current_price))
-            original = float(re.sub(r'[^\d.]', '', original_price))
-            
-            if original > current > 0:
-                return round(((original - current) / original) * 100, 2)
-        except (ValueError, ZeroDivisionError):
-            pass
-        return 0.0
-    
-    def _generate_deal_id(self, title: str, price: str) -> str:
-        """Generate unique deal ID"""
-        return f"myntra_{hash(title + price) % 1000000}"
-    
-    def _is_valid_deal(self, deal: Dict[str, Any]) -> bool:
-        """Validate if deal has required information"""
-        return (deal.get("title") and 
-                deal.get("current_price") and 
-                deal.get("url") and
-                len(deal.get("title", "")) > 5)
@@ -0,0 +1,66 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+class SelectorCascade:
+    """Ordered CSS selector fallbacks with per-selector hit/miss counts.
+
+    By default the declared order is always kept: field selector lists
+    overlap (a generic fallback can also match the strikethrough price), so
+    trying a lower-priority selector first would change what is extracted.
+    With ``memoize`` (used for the whole-page product container lookup) the
+    selector that matched last is tried first next time, and selectors
+    probed ``demote_after`` times without ever matching move to the back.
+    """
+
+    def __init__(self, selectors: List[str], demote_after: int = 3, memoize: bool = False):
+        self.selectors = list(selectors)
+        self.demote_after = demote_after
+        self.memoize = memoize
+        self._order = list(selectors)
+        self._lock = threading.Lock()
+        self.hits = dict.fromkeys(selectors, 0)
+        self.misses = dict.fromkeys(selectors, 0)
+
+    def select(self, root) -> list:
+        """All elements matched by the first selector that matches anything"""
+        for selector in list(self._order):
+            found = root.select(selector)
+            self._record(selector, bool(found))
+            if found:
+                return found
+        return []
+
+    def select_one(self, root, accept: Optional[Callable[[Any], Any]] = None):
+        """First element matched by the cascade (and passing ``accept``)"""
+        for selector in list(self._order):
+            elem = root.select_one(selector)
+            matched = elem is not None and (accept is None or accept(elem))
+            self._record(selector, matched)
+            if matched:
+                return elem
+        return None
+
+    def _record(self, selector: str, matched: bool):
+        with self._lock:
+            if matched:
+                self.hits[selector] += 1
+                if self.memoize and self._order[0] != selector:
+                    self._order.remove(selector)
+                    self._order.insert(0, selector)
+            else:
+                self.misses[selector] += 1
+                if (self.memoize and self.hits[selector] == 0
+                        and self.misses[selector] == self.demote_after
+                        and self._order[-1] != selector):
+                    self._order.remove(selector)
+                    self._order.append(selector)
+
+def merge_selector_stats(cascades: List[SelectorCascade]) -> Dict[str, Dict[str, int]]:
+    """Sum hit/miss counts for the same selector across cascades"""
+    stats: Dict[str, Dict[str, int]] = {}
+    for cascade in cascades:
+        for selector in cascade.selectors:
+            entry = stats.setdefault(selector, {"hits": 0, "misses": 0})
+            entry["hits"] += cascade.hits[selector]
+            entry["misses"] += cascade.misses[selector]
+    return stats
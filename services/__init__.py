@@ -0,0 +1,3 @@
+"""
+Deal aggregator backend services
+"""
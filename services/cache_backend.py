@@ -0,0 +1,161 @@
+import secrets
+import threading
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+from .store import DealStore
+
+class CacheEntry(NamedTuple):
+    deals: List[Dict[str, Any]]
+    scraped_at: datetime
+
+class CacheBackend:
+    """Storage behind ``deals_cache`` and ``cache_timestamp``.
+
+    ``entries`` is this process's view of the data. Writes go through
+    ``set``; ``sync`` pulls in writes made by other workers and reports
+    which platforms changed since the last call. Both may block on I/O,
+    so async callers run them in a worker thread.
+
+    ``version`` increases with every write and is the same in every worker
+    sharing the backend. It only orders writes within one ``epoch``, which
+    changes whenever the sequence starts over (a new process for the memory
+    backend, a new database file for SQLite).
+    """
+
+    def entries(self) -> Dict[str, CacheEntry]:
+        raise NotImplementedError
+
+    def set(self, platform: str, deals: List[Dict[str, Any]], scraped_at: datetime):
+        raise NotImplementedError
+
+    def sync(self) -> List[str]:
+        raise NotImplementedError
+
+    @property
+    def version(self) -> int:
+        raise NotImplementedError
+
+    @property
+    def epoch(self) -> str:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process cache (single worker, nothing persisted)"""
+
+    def __init__(self):
+        self._entries: Dict[str, CacheEntry] = {}
+        self._changed: List[str] = []
+        self._version = 0
+        self._epoch = secrets.token_hex(4)
+
+    def entries(self) -> Dict[str, CacheEntry]:
+        return self._entries
+
+    def set(self, platform: str, deals: List[Dict[str, Any]], scraped_at: datetime):
+        self._entries[platform] = CacheEntry(deals, scraped_at)
+        self._version += 1
+        self._changed.append(platform)
+
+    def sync(self) -> List[str]:
+        changed, self._changed = list(dict.fromkeys(self._changed)), []
+        return changed
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def epoch(self) -> str:
+        return self._epoch
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache shared by every worker through one SQLite (WAL) file.
+
+    Each worker keeps a decoded copy of the rows and only re-reads the
+    rows whose version is newer than the last one it synced.
+    """
+
+    def __init__(self, store: DealStore):
+        self.store = store
+        self._entries: Dict[str, CacheEntry] = {}
+        self._changed: List[str] = []
+        self._version = -1
+        self._epoch = store.epoch()
+        self._lock = threading.Lock()
+
+    def entries(self) -> Dict[str, CacheEntry]:
+        return self._entries
+
+    def set(self, platform: str, deals: List[Dict[str, Any]], scraped_at: datetime):
+        """Update this worker's copy, then persist it for the others.
+
+        If persisting fails (e.g. the database stays locked), the error is
+        raised but this worker keeps serving the new deals.
+        """
+        with self._lock:
+            self._entries[platform] = CacheEntry(deals, scraped_at)
+            self._changed.append(platform)
+        self.store.save_platform(platform, deals, scraped_at)
+
+    def sync(self) -> List[str]:
+        rows, version = self.store.load_since(self._version)
+        with self._lock:
+            for platform, (deals, scraped_at) in rows.items():
+                self._entries[platform] = CacheEntry(deals, scraped_at)
+            self._version = version
+            changed, self._changed = list(dict.fromkeys(self._changed + list(rows))), []
+        return changed
+
+    @property
+    def version(self) -> int:
+        return max(self._version, 0)
+
+    @property
+    def epoch(self) -> str:
+        return self._epoch
+
+    def close(self):
+        self.store.close()
+
+def create_cache_backend(kind: str, db_path: str) -> CacheBackend:
+    """Build the cache backend named by ``kind`` ('sqlite' or 'memory')"""
+    if kind == "memory":
+        return MemoryCacheBackend()
+    if kind == "sqlite":
+        return SQLiteCacheBackend(DealStore(db_path))
+    raise ValueError(f"Unknown cache backend {kind!r}")
+
+class DealsCacheView(Mapping):
+    """Read-only ``platform -> deals`` mapping over a cache backend"""
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    def __getitem__(self, platform: str) -> List[Dict[str, Any]]:
+        return self.backend.entries()[platform].deals
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.backend.entries()))
+
+    def __len__(self) -> int:
+        return len(self.backend.entries())
+
+class TimestampView(Mapping):
+    """Read-only ``platform -> scrape time`` mapping over a cache backend"""
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    def __getitem__(self, platform: str) -> datetime:
+        return self.backend.entries()[platform].scraped_at
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.backend.entries()))
+
+    def __len__(self) -> int:
+        return len(self.backend.entries())
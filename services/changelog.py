@@ -0,0 +1,76 @@
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+class Changelog:
+    """Bounded history of snapshot diffs, for catching clients up by version.
+
+    Diffs are kept in the order they were computed, each going from its
+    ``from_version`` to its ``version``, and each following on from the
+    one before. Once more than ``max_entries`` are held the oldest are
+    dropped, and clients behind the oldest one must fetch the full
+    snapshot instead. Versions only compare within one epoch; the caller
+    clears the log when the epoch changes.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._diffs: Deque[Dict[str, Any]] = deque(maxlen=max_entries)
+
+    def __len__(self) -> int:
+        return len(self._diffs)
+
+    def record(self, diff: Dict[str, Any]):
+        self._diffs.append(diff)
+
+    def clear(self):
+        self._diffs.clear()
+
+    @property
+    def oldest_version(self) -> Optional[int]:
+        """Oldest version a client can still catch up from"""
+        return self._diffs[0]["from_version"] if self._diffs else None
+
+    def since(self, version: int, current: int) -> Optional[Dict[str, Any]]:
+        """Deals added, changed and removed after ``version``, merged into one diff.
+
+        ``current`` is the version of the snapshot being served. Returns
+        None unless ``version`` is ``current`` or a diff boundary in the
+        log: a version inside a diff (a sync that covered several writes)
+        or before it may have seen deals that were added and removed again
+        in between, and their removal would be missing. Applied as upserts
+        and deletes, the merged diff is exact.
+        """
+        if version > current:
+            return None
+        if version == current:
+            return {"from_version": version, "version": current, "added": [], "changed": [], "removed": []}
+        if version != self.oldest_version and all(diff["version"] != version for diff in self._diffs):
+            return None
+
+        state: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        current = version
+        for diff in self._diffs:
+            if diff["version"] <= version:
+                continue
+            current = diff["version"]
+            for deal in diff["added"]:
+                previous = state.get(deal["id"])
+                kind = "changed" if previous is not None and previous[0] == "removed" else "added"
+                state[deal["id"]] = (kind, deal)
+            for deal in diff["changed"]:
+                previous = state.get(deal["id"])
+                kind = "added" if previous is not None and previous[0] == "added" else "changed"
+                state[deal["id"]] = (kind, deal)
+            for deal_id in diff["removed"]:
+                previous = state.get(deal_id)
+                if previous is not None and previous[0] == "added":
+                    del state[deal_id]
+                else:
+                    state[deal_id] = ("removed", None)
+
+        return {
+            "from_version": version,
+            "version": current,
+            "added": [deal for kind, deal in state.values() if kind == "added"],
+            "changed": [deal for kind, deal in state.values() if kind == "changed"],
+            "removed": [deal_id for deal_id, (kind, _) in state.items() if kind == "removed"]
+        }
@@ -0,0 +1,50 @@
+import time
+from typing import Any, Dict, List, Optional, Set
+
+class DealIndex:
+    """Deal-ID lookup table maintained alongside the deals cache.
+
+    Deals in a platform's current cache entry never expire. Deals that drop
+    out of it on refresh stay resolvable for ``retention`` seconds after
+    they rotated out, so a user who paid for a deal that was on screen can
+    still be verified.
+    """
+
+    def __init__(self, retention: float = 24 * 3600):
+        self.retention = retention
+        self._deals: Dict[str, Dict[str, Any]] = {}
+        # Rotated-out deal ID -> when it left its platform's current entry
+        self._rotated_out: Dict[str, float] = {}
+        self._current: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._deals)
+
+    def get(self, deal_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a current or recently rotated-out deal"""
+        return self._deals.get(deal_id)
+
+    def update_platform(self, platform: str, deals: List[Dict[str, Any]], now: Optional[float] = None):
+        """Index a platform's current deals and expire old rotated-out ones"""
+        now = time.time() if now is None else now
+        current = set()
+        for deal in deals:
+            deal_id = deal.get("id")
+            if not deal_id:
+                continue
+            self._deals[deal_id] = deal
+            self._rotated_out.pop(deal_id, None)
+            current.add(deal_id)
+
+        for deal_id in self._current.get(platform, set()) - current:
+            self._rotated_out.setdefault(deal_id, now)
+        self._current[platform] = current
+        self._expire(now)
+
+    def _expire(self, now: float):
+        cutoff = now - self.retention
+        expired = [deal_id for deal_id, since in self._rotated_out.items() if since < cutoff]
+        for deal_id in expired:
+            del self._rotated_out[deal_id]
+            if not any(deal_id in ids for ids in self._current.values()):
+                del self._deals[deal_id]
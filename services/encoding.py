@@ -0,0 +1,75 @@
+import gzip
+import json
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # brotli variants are simply not offered
+    brotli = None
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+# Content codings we can produce, in order of preference
+SUPPORTED_ENCODINGS: List[str] = (["br"] if brotli is not None else []) + ["gzip"]
+
+def dumps_json(payload: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON with the fastest available encoder"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return body
+
+def choose_encoding(accept_encoding: Optional[str]) -> str:
+    """Pick the supported content coding the client ranks highest.
+
+    Ties go to our own order of preference, so a plain 'gzip, br' gets br.
+    """
+    if not accept_encoding:
+        return "identity"
+
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    best, best_quality = "identity", 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+class EncodedBody:
+    """A JSON payload serialized once, with its compressed variants.
+
+    The identity body and every supported compressed variant are produced
+    up front, so serving it is just picking the bytes.
+    """
+
+    def __init__(self, payload: Any):
+        self.identity = dumps_json(payload)
+        self.variants: Dict[str, bytes] = {"identity": self.identity}
+        for encoding in SUPPORTED_ENCODINGS:
+            self.variants[encoding] = compress(self.identity, encoding)
+
+    def get(self, encoding: str) -> bytes:
+        return self.variants.get(encoding, self.identity)
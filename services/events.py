@@ -0,0 +1,38 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Set
+
+class ChangeFeed:
+    """Fan-out of in-process change notifications to async subscribers.
+
+    Each subscriber gets its own bounded queue. A subscriber that falls
+    ``max_pending`` items behind is dropped from the feed and receives
+    ``None`` (once it drains its queue), so one slow reader never makes
+    publishing block or grow memory without bound.
+    """
+
+    def __init__(self, max_pending: int = 64):
+        self.max_pending = max_pending
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, item: Any):
+        """Hand an item to every subscriber; call from the event loop thread"""
+        for queue in list(self._subscribers):
+            if queue.qsize() >= self.max_pending - 1:
+                self._subscribers.discard(queue)
+                queue.put_nowait(None)
+            else:
+                queue.put_nowait(item)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        """Queue receiving every item published while the context is open"""
+        queue: asyncio.Queue = asyncio.Queue(self.max_pending)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
@@ -0,0 +1,57 @@
+import logging
+import os
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; every process leads
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+class LeaderLock:
+    """Elects one scraping leader among workers with an OS file lock.
+
+    The worker holding an exclusive ``flock`` on ``path`` is the leader.
+    The kernel drops the lock when that process exits or dies, so another
+    worker's next ``try_acquire`` takes over automatically.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """Become leader if nobody else is; never blocks"""
+        if self._fd is not None:
+            return True
+        if fcntl is None:
+            self._fd = -1
+            return True
+
+        # Opened here rather than in __init__ so forked workers never share it
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        logger.info(f"Worker {os.getpid()} is now the scraping leader")
+        return True
+
+    def release(self):
+        """Give up leadership"""
+        if self._fd is None:
+            return
+        if self._fd >= 0:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        self._fd = None
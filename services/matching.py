@@ -0,0 +1,104 @@
+import hashlib
+import random
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .text import title_tokens
+
+_PRIME = (1 << 61) - 1
+
+def _token_hash(token: str) -> int:
+    """Process-independent 64-bit hash (``hash()`` is salted per process)"""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+class ProductMatcher:
+    """Finds the same product listed on different platforms.
+
+    Each deal's normalized title tokens get a MinHash signature, and the
+    signature is split into ``bands`` of ``rows`` values that are bucketed
+    (LSH). Two listings become candidates only if they share a bucket, which
+    happens with high probability above a Jaccard similarity of roughly
+    ``(1 / bands) ** (1 / rows)``; candidates are then confirmed with the
+    exact token-set Jaccard. Platforms are re-indexed independently when
+    their deals change.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 4, threshold: float = 0.5):
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        rng = random.Random(89)
+        self._perms = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(bands * rows)]
+        self._deals: Dict[str, Dict[str, Any]] = {}
+        self._tokens: Dict[str, FrozenSet[str]] = {}
+        self._bucket_keys: Dict[str, List[Tuple[int, Tuple[int, ...]]]] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = {}
+        self._by_platform: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._deals)
+
+    def _signature(self, tokens: FrozenSet[str]) -> List[int]:
+        hashes = [_token_hash(token) for token in tokens]
+        return [min((a * h + b) % _PRIME for h in hashes) for a, b in self._perms]
+
+    def update_platform(self, platform: str, deals: Iterable[Dict[str, Any]]):
+        """Replace a platform's listings in the index"""
+        for deal_id in self._by_platform.pop(platform, set()):
+            self._remove(deal_id)
+
+        current = set()
+        for deal in deals:
+            deal_id = deal.get("id")
+            tokens = frozenset(title_tokens(deal.get("title", "")))
+            if not deal_id or not tokens or deal_id in self._deals:
+                continue
+            signature = self._signature(tokens)
+            keys = [(band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+                    for band in range(self.bands)]
+            for key in keys:
+                self._buckets.setdefault(key, set()).add(deal_id)
+            self._deals[deal_id] = deal
+            self._tokens[deal_id] = tokens
+            self._bucket_keys[deal_id] = keys
+            current.add(deal_id)
+        self._by_platform[platform] = current
+
+    def _remove(self, deal_id: str):
+        for key in self._bucket_keys.pop(deal_id, []):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(deal_id)
+                if not bucket:
+                    del self._buckets[key]
+        self._deals.pop(deal_id, None)
+        self._tokens.pop(deal_id, None)
+
+    def get(self, deal_id: str) -> Optional[Dict[str, Any]]:
+        return self._deals.get(deal_id)
+
+    def matches(self, deal_id: str) -> List[Tuple[Dict[str, Any], float]]:
+        """Listings of the same product on other platforms, most similar first"""
+        deal = self._deals.get(deal_id)
+        if deal is None:
+            return []
+
+        candidates: Set[str] = set()
+        for key in self._bucket_keys[deal_id]:
+            candidates |= self._buckets.get(key, set())
+
+        tokens = self._tokens[deal_id]
+        found = []
+        for other_id in candidates:
+            other = self._deals[other_id]
+            if other_id == deal_id or other.get("platform") == deal.get("platform"):
+                continue
+            similarity = jaccard(tokens, self._tokens[other_id])
+            if similarity >= self.threshold:
+                found.append((other, round(similarity, 3)))
+        found.sort(key=lambda item: (-item[1], item[0]["id"]))
+        return found
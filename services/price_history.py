@@ -0,0 +1,167 @@
+import logging
+import sqlite3
+import sys
+import threading
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .snapshot import parse_price
+
+logger = logging.getLogger(__name__)
+
+# Points per chunk; a full chunk is never rewritten again
+CHUNK_POINTS = 128
+
+def _encode(timestamps: array, paise: array) -> bytes:
+    """Pack both columns little-endian and compress them"""
+    if sys.byteorder == "big":
+        timestamps, paise = array("q", timestamps), array("q", paise)
+        timestamps.byteswap()
+        paise.byteswap()
+    return zlib.compress(timestamps.tobytes() + paise.tobytes())
+
+def _decode(data: bytes, count: int) -> Tuple[array, array]:
+    raw = zlib.decompress(data)
+    timestamps, paise = array("q"), array("q")
+    timestamps.frombytes(raw[:count * 8])
+    paise.frombytes(raw[count * 8:])
+    if sys.byteorder == "big":
+        timestamps.byteswap()
+        paise.byteswap()
+    return timestamps, paise
+
+class PriceHistory:
+    """Append-only price time series per deal ID, in SQLite.
+
+    A deal's history is a run of chunks, each holding up to
+    ``CHUNK_POINTS`` (timestamp, price in paise) pairs as two ``array``
+    columns compressed with zlib. Only price changes are appended, so a
+    point's price holds until the next point. Chunks are indexed by their
+    first and last timestamp, and a range query reads only the chunks that
+    overlap the range.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS price_chunks (
+                deal_id TEXT NOT NULL,
+                start_ts INTEGER NOT NULL,
+                end_ts INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (deal_id, start_ts)
+            )
+            """
+        )
+
+    def record(self, deals: Iterable[Dict[str, Any]], timestamp: float) -> int:
+        """Append the current price of each deal; returns the number of points added"""
+        ts = int(timestamp)
+        prices: Dict[str, int] = {}
+        for deal in deals:
+            price = parse_price(deal.get("current_price", ""))
+            if deal.get("id") and price is not None and price > 0:
+                prices[deal["id"]] = round(price * 100)
+        if not prices:
+            return 0
+
+        added = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for deal_id, paise in prices.items():
+                    added += self._append(deal_id, ts, paise)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return added
+
+    def _append(self, deal_id: str, ts: int, paise: int) -> int:
+        row = self._conn.execute(
+            "SELECT start_ts, end_ts, count, data FROM price_chunks "
+            "WHERE deal_id = ? ORDER BY start_ts DESC LIMIT 1",
+            (deal_id,)
+        ).fetchone()
+
+        if row is not None:
+            start_ts, end_ts, count, data = row
+            timestamps, values = _decode(data, count)
+            if values[-1] == paise or ts <= end_ts:
+                return 0
+            if count < CHUNK_POINTS:
+                timestamps.append(ts)
+                values.append(paise)
+                self._conn.execute(
+                    "UPDATE price_chunks SET end_ts = ?, count = ?, data = ? "
+                    "WHERE deal_id = ? AND start_ts = ?",
+                    (ts, count + 1, _encode(timestamps, values), deal_id, start_ts)
+                )
+                return 1
+
+        self._conn.execute(
+            "INSERT INTO price_chunks (deal_id, start_ts, end_ts, count, data) VALUES (?, ?, ?, 1, ?)",
+            (deal_id, ts, ts, _encode(array("q", [ts]), array("q", [paise])))
+        )
+        return 1
+
+    def query(self, deal_id: str, start: Optional[float] = None,
+              end: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Price points of a deal within [start, end], or None if it has no history.
+
+        ``opening`` is the price in effect at ``start`` (the last change
+        before the range), so the lowest/highest figures cover the whole
+        range even when the price did not change inside it.
+        """
+        lo = int(start) if start is not None else -(1 << 62)
+        hi = int(end) if end is not None else 1 << 62
+
+        with self._lock:
+            chunks = self._conn.execute(
+                "SELECT count, data FROM price_chunks "
+                "WHERE deal_id = ? AND end_ts >= ? AND start_ts <= ? ORDER BY start_ts",
+                (deal_id, lo, hi)
+            ).fetchall()
+            before = self._conn.execute(
+                "SELECT count, data FROM price_chunks "
+                "WHERE deal_id = ? AND start_ts < ? ORDER BY start_ts DESC LIMIT 1",
+                (deal_id, lo)
+            ).fetchone()
+
+        if not chunks and before is None:
+            return None
+
+        opening = None
+        if before is not None:
+            count, data = before
+            timestamps, values = _decode(data, count)
+            i = bisect_left(timestamps, lo)
+            if i > 0:
+                opening = values[i - 1]
+
+        points: List[Tuple[int, int]] = []
+        for count, data in chunks:
+            timestamps, values = _decode(data, count)
+            i, j = bisect_left(timestamps, lo), bisect_right(timestamps, hi)
+            points.extend(zip(timestamps[i:j], values[i:j]))
+
+        in_range = [paise for _, paise in points] + ([opening] if opening is not None else [])
+        return {
+            "deal_id": deal_id,
+            "opening": opening / 100 if opening is not None else None,
+            "points": [{"timestamp": ts, "price": paise / 100} for ts, paise in points],
+            "lowest": min(in_range) / 100 if in_range else None,
+            "highest": max(in_range) / 100 if in_range else None
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
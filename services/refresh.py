@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one shared call.
+
+    The first caller for a key starts the work; callers arriving while it
+    is in flight await the same future instead of starting their own.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn`` for ``key`` or join the call already in flight"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        # Shield so one cancelled waiter doesn't cancel the shared call
+        return await asyncio.shield(future)
+
+    def _forget(self, key: str, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+class RefreshScheduler:
+    """Background loop that keeps each platform's cache entry fresh.
+
+    A platform is refreshed ``refresh_ahead`` seconds before its entry
+    reaches ``ttl``, so readers normally never see an expired entry. Readers
+    that do find stale data can call ``request_refresh`` and return
+    immediately (stale-while-revalidate).
+
+    With a ``leader`` lock, only the worker holding it refreshes; the rest
+    keep trying to acquire it every ``leader_poll`` seconds and take over
+    when the leader goes away.
+    """
+
+    def __init__(self, platforms: List[str],
+                 refresh: Callable[[str], Awaitable[None]],
+                 get_timestamp: Callable[[str], Optional[datetime]],
+                 ttl: float = 300, refresh_ahead: float = 60,
+                 retry_interval: float = 30, max_sleep: float = 30,
+                 leader=None, leader_poll: float = 5):
+        self.platforms = list(platforms)
+        self.leader = leader
+        self.leader_poll = leader_poll
+        self.refresh = refresh
+        self.get_timestamp = get_timestamp
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.retry_interval = retry_interval
+        self.max_sleep = max_sleep
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._last_attempt: Dict[str, float] = {}
+        self._loop_task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    def start(self):
+        """Start the scheduler loop on the running event loop"""
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel the scheduler loop and any in-progress refreshes"""
+        tasks = list(self._tasks.values())
+        if self._loop_task is not None:
+            tasks.append(self._loop_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._loop_task = None
+        if self.leader is not None:
+            self.leader.release()
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this worker is allowed to scrape"""
+        return self.leader is None or self.leader.is_leader
+
+    def request_refresh(self, platform: str) -> bool:
+        """Start a refresh now unless one is running or was just attempted"""
+        if not self.is_leader or platform in self._tasks:
+            return False
+        last_attempt = self._last_attempt.get(platform)
+        if last_attempt is not None and time.monotonic() - last_attempt < self.retry_interval:
+            return False
+        self._start_refresh(platform)
+        return True
+
+    def _seconds_until_due(self, platform: str) -> float:
+        """Seconds until the platform should be refreshed (<= 0 means now)"""
+        timestamp = self.get_timestamp(platform)
+        if timestamp is None:
+            due_in = 0.0
+        else:
+            age = (datetime.now() - timestamp).total_seconds()
+            due_in = self.ttl - self.refresh_ahead - age
+
+        # Don't hammer a platform whose last refresh failed or came back empty
+        last_attempt = self._last_attempt.get(platform)
+        if last_attempt is not None:
+            due_in = max(due_in, last_attempt + self.retry_interval - time.monotonic())
+        return due_in
+
+    def _start_refresh(self, platform: str):
+        self._last_attempt[platform] = time.monotonic()
+        task = asyncio.create_task(self._refresh_platform(platform))
+        self._tasks[platform] = task
+
+    async def _refresh_platform(self, platform: str):
+        try:
+            await self.refresh(platform)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Background refresh of {platform} failed: {str(e)}")
+        finally:
+            self._tasks.pop(platform, None)
+            self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            sleep_for = self.max_sleep
+
+            if self.leader is not None and not self.leader.try_acquire():
+                # Follower: other workers' refreshes arrive through the shared cache
+                await asyncio.sleep(self.leader_poll)
+                continue
+
+            for platform in self.platforms:
+                if platform in self._tasks:
+                    continue
+                due_in = self._seconds_until_due(platform)
+                if due_in <= 0:
+                    self._start_refresh(platform)
+                else:
+                    sleep_for = min(sleep_for, due_in)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=sleep_for)
+            except asyncio.TimeoutError:
+                pass
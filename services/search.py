@@ -0,0 +1,125 @@
+import math
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .text import search_tokens
+
+class SearchIndex:
+    """In-memory inverted index over deal titles.
+
+    Postings map each normalized token to the deals containing it and the
+    token's count in their title. Each platform's deals are replaced as a
+    unit when that platform refreshes. Results must contain every query
+    token (the last one may be a prefix, for search-as-you-type) and are
+    ranked by BM25 relevance boosted by the deal's discount. A term matched
+    only as a prefix scores ``prefix_weight`` of an exact match, and
+    numbers are never prefixes ('12' must not find '128gb').
+    """
+
+    def __init__(self, discount_weight: float = 0.5, prefix_weight: float = 0.5,
+                 k1: float = 1.2, b: float = 0.75):
+        self.discount_weight = discount_weight
+        self.prefix_weight = prefix_weight
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._deals: Dict[str, Dict[str, Any]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._by_platform: Dict[str, Set[str]] = {}
+        self._total_length = 0
+        self._vocabulary: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._deals)
+
+    def update_platform(self, platform: str, deals: Iterable[Dict[str, Any]]):
+        """Replace a platform's deals in the index"""
+        for deal_id in self._by_platform.pop(platform, set()):
+            self._remove(deal_id)
+
+        current = set()
+        for deal in deals:
+            deal_id = deal.get("id")
+            tokens = search_tokens(deal.get("title", ""))
+            if not deal_id or not tokens or deal_id in self._deals:
+                continue
+            for token, count in Counter(tokens).items():
+                self._postings.setdefault(token, {})[deal_id] = count
+            self._deals[deal_id] = deal
+            self._lengths[deal_id] = len(tokens)
+            self._total_length += len(tokens)
+            current.add(deal_id)
+        self._by_platform[platform] = current
+        self._vocabulary = None
+
+    def _remove(self, deal_id: str):
+        deal = self._deals.pop(deal_id, None)
+        if deal is None:
+            return
+        for token in set(search_tokens(deal.get("title", ""))):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(deal_id, None)
+                if not postings:
+                    del self._postings[token]
+        self._total_length -= self._lengths.pop(deal_id)
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Indexed tokens starting with ``prefix``"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect_left(self._vocabulary, prefix)
+        found = []
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            found.append(token)
+        return found
+
+    def search(self, query: str, platform: Optional[str] = None,
+               limit: int = 20) -> Tuple[List[Dict[str, Any]], int]:
+        """Best matching deals for a query, and the number of matches"""
+        tokens = search_tokens(query)
+        if not tokens or not self._deals:
+            return [], 0
+
+        # Each query term is a group of (index token, weight); the last also
+        # matches longer tokens it is a prefix of, unless it is a number
+        groups = [[(token, 1.0)] for token in tokens]
+        last = tokens[-1]
+        if not last[0].isdigit():
+            groups[-1].extend((token, self.prefix_weight)
+                              for token in self._expand_prefix(last) if token != last)
+
+        doc_count = len(self._deals)
+        avg_length = self._total_length / doc_count
+        scores: Optional[Dict[str, float]] = None
+        for group in groups:
+            group_scores: Dict[str, float] = {}
+            for token, weight in group:
+                postings = self._postings.get(token)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for deal_id, tf in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[deal_id] / avg_length)
+                    score = weight * idf * tf * (self.k1 + 1) / (tf + norm)
+                    group_scores[deal_id] = max(group_scores.get(deal_id, 0.0), score)
+            if scores is None:
+                scores = group_scores
+            else:
+                scores = {deal_id: score + group_scores[deal_id]
+                          for deal_id, score in scores.items() if deal_id in group_scores}
+            if not scores:
+                return [], 0
+
+        ranked = []
+        for deal_id, score in scores.items():
+            deal = self._deals[deal_id]
+            if platform is not None and deal.get("platform") != platform:
+                continue
+            discount = float(deal.get("discount_percentage", 0) or 0)
+            ranked.append((score * (1 + self.discount_weight * discount / 100), deal_id))
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        return [self._deals[deal_id] for _, deal_id in ranked[:limit]], len(ranked)
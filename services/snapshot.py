@@ -0,0 +1,255 @@
+import base64
+import hashlib
+import json
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .encoding import SUPPORTED_ENCODINGS, EncodedBody
+
+# Sort key of a deal in a snapshot: highest discount first, then deal ID
+SortKey = Tuple[float, str]
+
+# Sorts after every real deal ID with the same discount
+_MAX_ID = "\U0010ffff"
+
+def sort_key(deal: Dict[str, Any]) -> SortKey:
+    return (-float(deal.get("discount_percentage", 0)), str(deal.get("id", "")))
+
+def parse_price(price: str) -> Optional[float]:
+    """Numeric value of a price string such as '₹14,990'"""
+    try:
+        return float(re.sub(r'[^\d.]', '', price or ""))
+    except ValueError:
+        return None
+
+def encode_cursor(key: SortKey) -> str:
+    """Opaque pagination cursor for the last deal on a page"""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> SortKey:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        neg_discount, deal_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (float(neg_discount), str(deal_id))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def compute_etag(payload: Any) -> str:
+    """Strong ETag for a JSON-serializable payload"""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return bytes_etag(encoded)
+
+def bytes_etag(body: bytes) -> str:
+    """Strong ETag for an already-serialized body"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+def variant_etag(etag: str, encoding: str) -> str:
+    """ETag of a content-coded variant (strong ETags differ per coding)"""
+    if encoding == "identity":
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches the ETag or any of its coded variants"""
+    if not if_none_match:
+        return False
+    variants = {etag} | {variant_etag(etag, encoding) for encoding in SUPPORTED_ENCODINGS}
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate in variants:
+            return True
+    return False
+
+# Fields that change on every scrape even when the deal itself did not
+VOLATILE_FIELDS = frozenset(["scraped_at"])
+
+def same_deal(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    """Whether two versions of a deal differ only in volatile fields"""
+    keys = (a.keys() | b.keys()) - VOLATILE_FIELDS
+    return all(a.get(key) == b.get(key) for key in keys)
+
+def format_version(epoch: str, version: int) -> str:
+    """Client-facing snapshot version token, e.g. '1a2b3c4d-42'"""
+    return f"{epoch}-{version}"
+
+def parse_version(token: Optional[str], epoch: str) -> Optional[int]:
+    """Version number of a token from the current epoch, else None"""
+    token_epoch, _, number = (token or "").rpartition("-")
+    if token_epoch != epoch or not number.isdigit():
+        return None
+    return int(number)
+
+def project(deal: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Restrict a deal to the requested fields"""
+    if not fields:
+        return deal
+    return {name: deal[name] for name in fields if name in deal}
+
+@dataclass(frozen=True)
+class DealSnapshot:
+    """Merged, deduplicated and sorted view of every platform's deals.
+
+    Built once whenever a platform's cache entry changes and then served
+    as-is; the deal dicts are private copies and must not be mutated.
+
+    Deals are ordered by ``sort_key``. Alongside them the snapshot keeps
+    per-platform views and the sorted keys of each view, so a query for a
+    platform and minimum discount is a dict lookup plus a bisect, and
+    cursors resume by key (stable across snapshot rebuilds).
+    """
+
+    version: int
+    deals: Tuple[Dict[str, Any], ...]
+    # Identifies the version sequence; see format_version
+    epoch: str = ""
+    etag: str = ""
+    # The /deals response, serialized and compressed once
+    body: Optional[EncodedBody] = None
+    # Each platform's cached deals as scraped (or its samples), for /deals/{platform}
+    cached_deals: Dict[str, Tuple[Dict[str, Any], ...]] = field(default_factory=dict)
+    cached_etags: Dict[str, str] = field(default_factory=dict)
+    platform_deals: Dict[str, Tuple[Dict[str, Any], ...]] = field(default_factory=dict)
+    by_id: Dict[str, Dict[str, Any]] = field(default_factory=dict, repr=False)
+    _platform_bodies: Dict[Tuple[str, bool], EncodedBody] = field(default_factory=dict, repr=False)
+    _keys: Dict[Optional[str], List[SortKey]] = field(default_factory=dict, repr=False)
+    _prices: Dict[Optional[str], List[Optional[float]]] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self.by_id.update((deal["id"], deal) for deal in self.deals if deal.get("id"))
+        views = {None: self.deals}
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for deal in self.deals:
+            grouped.setdefault(deal["platform"], []).append(deal)
+        for platform, deals in grouped.items():
+            self.platform_deals[platform] = views[platform] = tuple(deals)
+
+        for name, deals in views.items():
+            self._keys[name] = [sort_key(deal) for deal in deals]
+            self._prices[name] = [parse_price(deal.get("current_price", "")) for deal in deals]
+
+    @property
+    def version_token(self) -> str:
+        return format_version(self.epoch, self.version)
+
+    def platform_body(self, platform: str, stale: bool) -> EncodedBody:
+        """The /deals/{platform} response, encoded on first use and then reused"""
+        key = (platform, stale)
+        body = self._platform_bodies.get(key)
+        if body is None:
+            body = self._platform_bodies[key] = EncodedBody(
+                {"platform": platform, "deals": self.cached_deals[platform], "stale": stale}
+            )
+        return body
+
+    def query(self, platform: Optional[str] = None, min_discount: Optional[float] = None,
+              max_price: Optional[float] = None, after: Optional[SortKey] = None,
+              limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], int, Optional[SortKey]]:
+        """Filter and paginate the snapshot.
+
+        Returns the page of deals, the number of deals matching the filters
+        and the sort key to resume after (None on the last page).
+        """
+        if platform is not None and platform not in self.platform_deals:
+            return [], 0, None
+        deals = self.platform_deals[platform] if platform is not None else self.deals
+        keys = self._keys[platform]
+        prices = self._prices[platform]
+
+        # Deals are sorted by descending discount, so a minimum discount is a prefix
+        end = len(deals)
+        if min_discount is not None:
+            end = bisect_right(keys, (-min_discount, _MAX_ID))
+        start = bisect_right(keys, after) if after is not None else 0
+
+        if max_price is None:
+            total = end
+            page_indexes = range(start, end)
+        else:
+            matching = [i for i in range(end)
+                        if prices[i] is not None and prices[i] <= max_price]
+            total = len(matching)
+            page_indexes = [i for i in matching if i >= start]
+
+        has_more = limit is not None and len(page_indexes) > limit
+        if limit is not None:
+            page_indexes = page_indexes[:limit]
+
+        page = [deals[i] for i in page_indexes]
+        next_key = keys[page_indexes[-1]] if has_more else None
+        return page, total, next_key
+
+def diff_snapshots(old: DealSnapshot, new: DealSnapshot) -> Dict[str, Any]:
+    """Deals added, changed and removed (by ID) going from ``old`` to ``new``"""
+    added = []
+    changed = []
+    for deal_id, deal in new.by_id.items():
+        previous = old.by_id.get(deal_id)
+        if previous is None:
+            added.append(deal)
+        elif not same_deal(previous, deal):
+            changed.append(deal)
+    removed = [deal_id for deal_id in old.by_id if deal_id not in new.by_id]
+    return {
+        "from_version": old.version,
+        "version": new.version,
+        "added": added,
+        "changed": changed,
+        "removed": removed
+    }
+
+def build_snapshot(version: int,
+                   sample_deals: Dict[str, List[Dict[str, Any]]],
+                   deals_cache: Dict[str, List[Dict[str, Any]]],
+                   platforms: Iterable[str],
+                   epoch: str = "") -> DealSnapshot:
+    """Merge sample and cached deals into a new snapshot"""
+    all_deals = []
+
+    # Sample deals first, to ensure immediate display
+    for platform, platform_deals in sample_deals.items():
+        for deal in platform_deals:
+            deal_copy = deal.copy()
+            deal_copy["platform"] = platform
+            all_deals.append(deal_copy)
+
+    for platform in platforms:
+        for deal in deals_cache.get(platform, []):
+            deal_copy = deal.copy()
+            deal_copy["platform"] = platform
+            all_deals.append(deal_copy)
+
+    # Remove duplicates and sort by discount percentage
+    seen_titles = set()
+    unique_deals = []
+    for deal in all_deals:
+        title_key = f"{deal['platform']}_{deal['title'][:50]}"
+        if title_key not in seen_titles:
+            seen_titles.add(title_key)
+            unique_deals.append(deal)
+
+    unique_deals.sort(key=sort_key)
+
+    cached_deals = {}
+    cached_etags = {}
+    for platform in platforms:
+        platform_deals = tuple(deals_cache.get(platform, sample_deals.get(platform, [])))
+        cached_deals[platform] = platform_deals
+        cached_etags[platform] = compute_etag(platform_deals)
+
+    deals = tuple(unique_deals)
+    body = EncodedBody({"deals": deals, "total_count": len(deals)})
+
+    return DealSnapshot(
+        version=version,
+        deals=deals,
+        epoch=epoch,
+        etag=bytes_etag(body.identity),
+        body=body,
+        cached_deals=cached_deals,
+        cached_etags=cached_etags
+    )
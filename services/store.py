@@ -0,0 +1,93 @@
+import json
+import logging
+import secrets
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+class DealStore:
+    """SQLite persistence for scraped deals, shared by every worker.
+
+    The database runs in WAL mode: readers never block the writer, and a
+    platform's deals are written as one row per refresh. Every write bumps
+    a global version counter and stamps the row with it, so a reader can
+    cheaply ask for just the rows changed since the version it last saw.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS platform_deals (
+                platform TEXT PRIMARY KEY,
+                deals TEXT NOT NULL,
+                scraped_at REAL NOT NULL,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(platform_deals)")]
+        if "version" not in columns:
+            self._conn.execute("ALTER TABLE platform_deals ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('version', 0)")
+        # Random per-database ID, so versions from a wiped or replaced file never compare equal
+        self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('epoch', ?)",
+                           (secrets.randbits(31),))
+
+    def epoch(self) -> str:
+        """Identifier of this database's version sequence"""
+        with self._lock:
+            value = self._conn.execute("SELECT value FROM meta WHERE key = 'epoch'").fetchone()[0]
+        return f"{value:08x}"
+
+    def save_platform(self, platform: str, deals: List[Dict[str, Any]], scraped_at: datetime) -> int:
+        """Persist a platform's current deals; returns the new global version"""
+        payload = json.dumps(deals, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'version'")
+                version = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0]
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO platform_deals (platform, deals, scraped_at, version) "
+                    "VALUES (?, ?, ?, ?)",
+                    (platform, payload, scraped_at.timestamp(), version)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return version
+
+    def load_since(self, version: int = -1) -> Tuple[Dict[str, Tuple[List[Dict[str, Any]], datetime]], int]:
+        """Platforms written after ``version``, and the current global version"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                current = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0]
+                rows = self._conn.execute(
+                    "SELECT platform, deals, scraped_at FROM platform_deals WHERE version > ?",
+                    (version,)
+                ).fetchall()
+            finally:
+                self._conn.execute("COMMIT")
+
+        loaded = {}
+        for platform, deals, scraped_at in rows:
+            try:
+                loaded[platform] = (json.loads(deals), datetime.fromtimestamp(scraped_at))
+            except ValueError as e:
+                logger.error(f"Skipping corrupt stored deals for {platform}: {str(e)}")
+        return loaded, current
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,72 @@
+import re
+from typing import List
+
+# Quantity units as retailers write them, mapped to one spelling
+UNIT_ALIASES = {
+    "gb": "gb", "gigabyte": "gb", "gigabytes": "gb",
+    "tb": "tb", "mb": "mb",
+    "kg": "kg", "kgs": "kg", "kilo": "kg", "kilogram": "kg", "kilograms": "kg",
+    "g": "g", "gm": "g", "gms": "g", "gram": "g", "grams": "g", "gr": "g",
+    "l": "l", "ltr": "l", "ltrs": "l", "litre": "l", "litres": "l", "liter": "l", "liters": "l",
+    "ml": "ml", "mah": "mah", "w": "w", "watt": "w", "watts": "w",
+    "inch": "in", "inches": "in", "in": "in", "cm": "cm", "mm": "mm",
+    "pc": "pc", "pcs": "pc", "piece": "pc", "pieces": "pc", "pack": "pack", "n": "n",
+}
+
+STOPWORDS = {"the", "and", "with", "for", "of", "a", "an", "in", "to", "by", "on", "new", "combo"}
+
+_NUMBER_UNIT = re.compile(r"(\d+(?:\.\d+)?)\s*([a-z]+)\b")
+
+def title_tokens(title: str) -> List[str]:
+    """Normalized tokens of a product title.
+
+    Lowercases, glues numbers to their (canonical) unit so '128 GB' and
+    '128GB' agree, drops punctuation and filler words.
+    """
+    text = (title or "").lower().replace("&", " and ")
+
+    def unit(match: "re.Match") -> str:
+        number, suffix = match.group(1), match.group(2)
+        canonical = UNIT_ALIASES.get(suffix)
+        if canonical is None:
+            return match.group(0)
+        return f" {number.rstrip('0').rstrip('.') if '.' in number else number}{canonical} "
+
+    text = _NUMBER_UNIT.sub(unit, text)
+    text = re.sub(r"[^\w.\s]|(?<!\d)\.|\.(?!\d)", " ", text)
+    return [token for token in text.split() if token not in STOPWORDS]
+
+# Hindi/Hinglish grocery names and retail spellings, mapped to one search term
+RETAIL_SYNONYMS = {
+    "atta": "flour", "maida": "flour",
+    "chawal": "rice", "dal": "lentil", "daal": "lentil",
+    "dahi": "curd", "doodh": "milk", "makhan": "butter",
+    "cheeni": "sugar", "chini": "sugar", "namak": "salt",
+    "aloo": "potato", "pyaz": "onion", "pyaaz": "onion", "tamatar": "tomato",
+    "sabzi": "vegetable", "sabji": "vegetable", "veggies": "vegetable",
+    "chai": "tea", "haldi": "turmeric", "jeera": "cumin", "mirchi": "chilli", "chili": "chilli",
+    "tel": "oil",
+    "mobile": "phone", "smartphone": "phone", "cellphone": "phone",
+    "tv": "television", "telly": "television",
+    "earphone": "earbud", "earphones": "earbud", "headphone": "headphones",
+    "tee": "tshirt", "tees": "tshirt",
+    "mens": "men", "womens": "women", "gents": "men", "ladies": "women", "kids": "kid",
+    "sneaker": "shoe", "sneakers": "shoe", "footwear": "shoe",
+}
+
+def search_tokens(text: str) -> List[str]:
+    """Title tokens further normalized for search.
+
+    Joins 't-shirt'/'t shirt' style splits, folds Hindi and retail
+    synonyms into one term and strips simple plurals, so 'Atta 5kg'
+    finds 'Whole Wheat Flour 5 kg'.
+    """
+    text = re.sub(r"\bt[\s-]?shirts?\b", "tshirt", (text or "").lower())
+    text = re.sub(r"\b(\w+)'s\b", r"\1s", text)
+    tokens = []
+    for token in title_tokens(text):
+        token = RETAIL_SYNONYMS.get(token, token)
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss") and not token[0].isdigit():
+            token = token[:-1]
+        tokens.append(RETAIL_SYNONYMS.get(token, token))
+    return tokens
@@ -7,6 +7,7 @@ class DealAggregator {
         this.currentFilter = 'all';
         this.isLoading = false;
         this.backendUrl = window.location.origin; // Use same origin since we're serving from FastAPI
+        this.eventSource = null;
         
         this.init();
     }
@@ -14,6 +15,44 @@ class DealAggregator {
     init() {
         this.setupEventListeners();
         this.loadDeals();
+        this.subscribeToUpdates();
+    }
+
+    subscribeToUpdates() {
+        // The server pushes deal diffs as refreshes land; EventSource reconnects on its own
+        if (!window.EventSource) return;
+
+        this.eventSource = new EventSource(`${this.backendUrl}/deals/events`);
+        this.eventSource.addEventListener('deals', (e) => {
+            this.applyDealChanges(JSON.parse(e.data));
+        });
+        this.eventSource.addEventListener('resync', () => {
+            this.loadDeals();
+        });
+    }
+
+    applyDealChanges(diff) {
+        // Patch this.deals in place instead of re-downloading the list
+        const removed = new Set(diff.removed || []);
+        const changed = new Map((diff.changed || []).map(deal => [deal.id, deal]));
+
+        for (let i = this.deals.length - 1; i >= 0; i--) {
+            const deal = this.deals[i];
+            if (removed.has(deal.id)) {
+                this.deals.splice(i, 1);
+            } else if (changed.has(deal.id)) {
+                this.deals[i] = changed.get(deal.id);
+                changed.delete(deal.id);
+            }
+        }
+
+        const known = new Set(this.deals.map(deal => deal.id));
+        (diff.added || []).concat([...changed.values()]).forEach(deal => {
+            if (!known.has(deal.id)) this.deals.push(deal);
+        });
+        this.deals.sort((a, b) => (b.discount_percentage || 0) - (a.discount_percentage || 0));
+
+        this.filterDeals(this.currentFilter);
     }
 
     setupEventListeners() {
@@ -45,26 +84,11 @@ class DealAggregator {
         this.hideError();
 
         try {
-            const url = `${this.backendUrl}/deals${forceRefresh ? '?refresh=true' : ''}`;
-            const response = await fetch(url, {
-                method: 'GET',
-                headers: {
-                    'Accept': 'application/json',
-                    'Content-Type': 'application/json'
-                }
-            });
-
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
+            if (window.ReadableStream && window.TextDecoder) {
+                await this.streamDeals();
+            } else {
+                await this.fetchAllDeals(forceRefresh);
             }
-
-            const data = await response.json();
-            this.deals = data.deals || [];
-            this.filteredDeals = [...this.deals];
-            
-            this.renderDeals();
-            this.updateDealCount();
-            
         } catch (error) {
             console.error('Error loading deals:', error);
             this.showError('Failed to load deals. Please check your internet connection and try again.');
@@ -74,6 +98,66 @@ class DealAggregator {
         }
     }
 
+    async fetchAllDeals(forceRefresh = false) {
+        const url = `${this.backendUrl}/deals${forceRefresh ? '?refresh=true' : ''}`;
+        const response = await fetch(url, {
+            method: 'GET',
+            headers: {
+                'Accept': 'application/json',
+                'Content-Type': 'application/json'
+            }
+        });
+
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+
+        const data = await response.json();
+        this.deals = data.deals || [];
+        this.filterDeals(this.currentFilter);
+    }
+
+    async streamDeals() {
+        // One NDJSON line per platform; render each as soon as it arrives
+        const response = await fetch(`${this.backendUrl}/deals/stream`, {
+            method: 'GET',
+            headers: { 'Accept': 'application/x-ndjson' }
+        });
+
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (true) {
+            const { done, value } = await reader.read();
+            buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.filter(line => line.trim()).forEach(line => {
+                this.applyPlatformDeals(JSON.parse(line));
+            });
+
+            if (done) break;
+        }
+    }
+
+    applyPlatformDeals(chunk) {
+        if (!chunk.platform) return;
+
+        // Replace just this platform's deals and keep the list sorted by discount
+        const deals = (chunk.deals || []).map(deal => ({ ...deal, platform: chunk.platform }));
+        this.deals = this.deals.filter(deal => deal.platform !== chunk.platform).concat(deals);
+        this.deals.sort((a, b) => (b.discount_percentage || 0) - (a.discount_percentage || 0));
+
+        this.showLoading(false);
+        this.filterDeals(this.currentFilter);
+    }
+
     filterDeals(platform) {
         this.currentFilter = platform;
         
@@ -407,8 +491,11 @@ document.addEventListener('DOMContentLoaded', () => {
 
 // Handle page visibility change to refresh deals
 document.addEventListener('visibilitychange', () => {
-    if (!document.hidden && window.dealAggregator) {
-        // Refresh deals when user returns to tab
+    const aggregator = window.dealAggregator;
+    const live = aggregator && aggregator.eventSource &&
+        aggregator.eventSource.readyState !== EventSource.CLOSED;
+    if (!document.hidden && aggregator && !live) {
+        // Refresh deals when user returns to tab (pushed updates keep a live tab current)
         setTimeout(() => {
             window.dealAggregator.loadDeals();
         }, 1000);
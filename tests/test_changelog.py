@@ -0,0 +1,49 @@
+from services.changelog import Changelog
+from services.snapshot import format_version, parse_version
+
+def diff(from_version, version, added=(), removed=()):
+    return {"from_version": from_version, "version": version,
+            "added": list(added), "changed": [], "removed": list(removed)}
+
+def test_version_newer_than_current_needs_full_snapshot():
+    log = Changelog()
+    log.record(diff(1, 2, added=[{"id": "a"}]))
+    assert log.since(5, current=2) is None
+
+def test_current_version_is_up_to_date_even_with_empty_log():
+    changes = Changelog().since(3, current=3)
+    assert changes == diff(3, 3)
+
+def test_merges_diffs_after_version():
+    log = Changelog()
+    log.record(diff(1, 2, added=[{"id": "a"}]))
+    log.record(diff(2, 3, added=[{"id": "b"}], removed=["a"]))
+    changes = log.since(1, current=3)
+    assert changes["version"] == 3
+    assert changes["added"] == [{"id": "b"}]
+    assert changes["removed"] == []
+    assert log.since(0, current=3) is None
+
+def test_version_before_first_synced_version_needs_full_snapshot():
+    # A worker's log starts at the version it loaded at startup (7); a
+    # client at 1 may hold deals removed before then
+    log = Changelog()
+    log.record(diff(7, 8, added=[{"id": "a"}]))
+    assert log.since(1, current=8) is None
+    assert log.since(7, current=8)["added"] == [{"id": "a"}]
+
+def test_version_inside_a_multi_version_diff_needs_full_snapshot():
+    # One sync went from 2 to 5; a client at 3 may have seen a deal added
+    # and removed again at 4, which this diff cannot report
+    log = Changelog()
+    log.record(diff(2, 5, added=[{"id": "b"}]))
+    log.record(diff(5, 6, removed=["b"]))
+    assert log.since(3, current=6) is None
+    assert log.since(5, current=6)["removed"] == ["b"]
+
+def test_version_tokens_only_parse_within_their_epoch():
+    token = format_version("1a2b3c4d", 42)
+    assert parse_version(token, "1a2b3c4d") == 42
+    assert parse_version(token, "1a2b3c4d.1") is None
+    assert parse_version("42", "1a2b3c4d") is None
+    assert parse_version("1a2b3c4d-x", "1a2b3c4d") is None
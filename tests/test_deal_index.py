@@ -0,0 +1,25 @@
+from services.deal_index import DealIndex
+
+def test_rotated_out_deal_expires_after_retention():
+    index = DealIndex(retention=100)
+    index.update_platform("amazon", [{"id": "a1"}], now=0)
+    index.update_platform("amazon", [{"id": "a2"}], now=10)
+    assert index.get("a1") is not None
+    index.update_platform("amazon", [{"id": "a2"}], now=111)
+    assert index.get("a1") is None
+    assert index.get("a2") is not None
+
+def test_current_deals_never_expire():
+    index = DealIndex(retention=100)
+    index.update_platform("amazon", [{"id": "a1"}], now=0)
+    # Another platform refreshing much later must not expire amazon's on-screen deals
+    index.update_platform("flipkart", [{"id": "f1"}], now=1000)
+    assert index.get("a1") is not None
+
+def test_deal_back_in_cache_is_no_longer_rotated_out():
+    index = DealIndex(retention=100)
+    index.update_platform("amazon", [{"id": "a1"}], now=0)
+    index.update_platform("amazon", [], now=10)
+    index.update_platform("amazon", [{"id": "a1"}], now=50)
+    index.update_platform("amazon", [{"id": "a1"}], now=500)
+    assert index.get("a1") is not None
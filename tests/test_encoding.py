@@ -0,0 +1,11 @@
+from services.encoding import SUPPORTED_ENCODINGS, choose_encoding
+
+def test_highest_quality_wins():
+    assert choose_encoding("br;q=0.1, gzip;q=1.0") == "gzip"
+
+def test_server_order_breaks_ties():
+    assert choose_encoding("gzip, br") == SUPPORTED_ENCODINGS[0]
+
+def test_refused_codings_fall_back_to_identity():
+    assert choose_encoding("gzip;q=0, br;q=0") == "identity"
+    assert choose_encoding(None) == "identity"
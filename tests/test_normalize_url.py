@@ -0,0 +1,37 @@
+from scrapers.base import BaseScraper, normalize_product_url
+
+SSPA_IPHONE = (
+    "https://www.amazon.in/sspa/click?ie=UTF8&spc=MTox&sp_csd=d2lkZ2V0"
+    "&url=%2FApple-iPhone-13-128GB-Blue%2Fdp%2FB09G9BL5CP%2Fref%3Dsr_1_1_sspa"
+    "%3Fkeywords%3Diphone%26qid%3D1700000000%26sr%3D8-1-spons%26psc%3D1"
+)
+SSPA_OTHER = "https://www.amazon.in/sspa/click?ie=UTF8&url=%2FBoAt-Airdopes-141%2Fdp%2FB09N3ZNHTY%2Fref%3Dsr_1_2_sspa"
+
+def test_sponsored_amazon_results_unwrap_to_the_product():
+    assert normalize_product_url(SSPA_IPHONE) == "https://www.amazon.in/Apple-iPhone-13-128GB-Blue/dp/B09G9BL5CP"
+    assert normalize_product_url(SSPA_OTHER) == "https://www.amazon.in/BoAt-Airdopes-141/dp/B09N3ZNHTY"
+
+def test_sponsored_result_matches_organic_listing():
+    organic = "https://www.amazon.in/Apple-iPhone-13-128GB-Blue/dp/B09G9BL5CP/ref=sr_1_3?qid=1&sr=8-3"
+    assert normalize_product_url(SSPA_IPHONE) == normalize_product_url(organic)
+
+def test_flipkart_variants_keep_pid():
+    base = "https://www.flipkart.com/apple-iphone-13-blue-128-gb/p/itm6ac6485515ae4"
+    blue = normalize_product_url(f"{base}?pid=MOBG6VF5Q82T3XRS&lid=LSTMOBG6&marketplace=FLIPKART&srno=s_1_1")
+    pink = normalize_product_url(f"{base}?pid=MOBG6VF5SMXPNQHG&lid=LSTMOBG7&marketplace=FLIPKART")
+    assert blue == f"{base}?pid=MOBG6VF5Q82T3XRS"
+    assert blue != pink
+
+def test_tracking_params_fragment_and_host_case_are_dropped():
+    url = "https://WWW.Myntra.com/tshirts/roadster/123/buy/?utm_source=fb&utm_medium=cpc&gclid=x#reviews"
+    assert normalize_product_url(url) == "https://www.myntra.com/tshirts/roadster/123/buy"
+
+def test_identifying_params_are_kept_in_sorted_order():
+    a = normalize_product_url("https://example.com/item?sku=2&asin=B0&utm_campaign=x")
+    b = normalize_product_url("https://example.com/item?asin=B0&sku=2")
+    assert a == b == "https://example.com/item?asin=B0&sku=2"
+
+def test_deal_ids_differ_for_distinct_sponsored_products():
+    scraper = BaseScraper()
+    scraper.platform = "amazon"
+    assert scraper._generate_deal_id(SSPA_IPHONE, "iPhone") != scraper._generate_deal_id(SSPA_OTHER, "Airdopes")
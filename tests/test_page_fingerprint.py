@@ -0,0 +1,42 @@
+import asyncio
+
+from scrapers.base import BaseScraper, page_fingerprint
+from scrapers.executor import ScrapeExecutor
+
+def test_script_style_and_comments_do_not_affect_fingerprint():
+    a = b'<ul><li>Atta</li></ul><script nonce="1">t=1</script><style>.x{}</style><!-- 10:01 -->'
+    b = b'<ul><li>Atta</li></ul><SCRIPT nonce="2">t=2</SCRIPT ><style>.y{}</style><!-- 10:02 -->'
+    assert page_fingerprint(a) == page_fingerprint(b)
+
+def test_product_markup_changes_fingerprint():
+    assert page_fingerprint(b"<li>Atta 5kg</li>") != page_fingerprint(b"<li>Atta 10kg</li>")
+
+def test_lookalike_tags_are_kept():
+    assert page_fingerprint(b"<scripts>1</scripts>") != page_fingerprint(b"<scripts>2</scripts>")
+
+def test_many_unterminated_script_tags():
+    page = b"<div>deal</div><script " * 20000
+    assert len(page_fingerprint(page)) == 32
+
+class CountingScraper(BaseScraper):
+    platform = "test"
+
+    def __init__(self):
+        super().__init__()
+        self.parses = 0
+
+    def _parse_deals_page(self, content, url):
+        self.parses += 1
+        return [{"id": "test_1"}]
+
+def test_executor_skips_parse_for_unchanged_page():
+    scraper = CountingScraper()
+    executor = ScrapeExecutor(max_workers=1)
+    try:
+        fingerprint, deals = asyncio.run(executor.parse(scraper, b"<li>a</li>", "u"))
+        assert deals == [{"id": "test_1"}]
+        again, deals = asyncio.run(executor.parse(scraper, b"<li>a</li><!-- x -->", "u", fingerprint))
+        assert again == fingerprint and deals is None
+        assert scraper.parses == 1
+    finally:
+        executor.shutdown()
@@ -0,0 +1,23 @@
+from services.search import SearchIndex
+
+def deal(deal_id, title):
+    return {"id": deal_id, "title": title, "platform": "amazon", "discount_percentage": 0}
+
+def test_number_is_not_a_prefix():
+    index = SearchIndex()
+    index.update_platform("amazon", [
+        deal("ip13", "Apple iPhone 13 (Blue, 128 GB)"),
+        deal("ip12", "Apple iPhone 12"),
+    ])
+    results, total = index.search("iphone 12")
+    assert [d["id"] for d in results] == ["ip12"]
+    assert total == 1
+
+def test_exact_last_term_beats_longer_token_with_same_prefix():
+    index = SearchIndex()
+    index.update_platform("amazon", [
+        deal("phones", "Boat Headphones"),
+        deal("head", "Boat Head Massager"),
+    ])
+    results, _ = index.search("boat head")
+    assert [d["id"] for d in results] == ["head", "phones"]
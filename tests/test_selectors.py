@@ -0,0 +1,31 @@
+from scrapers.selectors import SelectorCascade
+
+class StubElement:
+    """Minimal stand-in for a BeautifulSoup element"""
+
+    def __init__(self, *classes):
+        self.classes = set(classes)
+
+    def select_one(self, selector):
+        return selector if selector in self.classes else None
+
+    def select(self, selector):
+        return [selector] if selector in self.classes else []
+
+def test_field_cascade_keeps_declared_priority():
+    # Flipkart-style list: the last fallback also matches the strikethrough MRP
+    cascade = SelectorCascade(["._30jeq3", "._1_WHN1", "._3I9_wc"])
+    for _ in range(5):
+        assert cascade.select_one(StubElement("._3I9_wc")) == "._3I9_wc"
+    assert cascade.select_one(StubElement("._30jeq3", "._3I9_wc")) == "._30jeq3"
+
+def test_field_cascade_counts_hits_and_misses():
+    cascade = SelectorCascade(["a", "b"])
+    cascade.select_one(StubElement("b"))
+    assert cascade.hits == {"a": 0, "b": 1}
+    assert cascade.misses == {"a": 1, "b": 0}
+
+def test_memoized_cascade_tries_last_hit_first():
+    cascade = SelectorCascade(["a", "b", "c"], memoize=True)
+    assert cascade.select(StubElement("b")) == ["b"]
+    assert cascade.select(StubElement("a", "b")) == ["b"]